@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd`
+====================================================
+
+Opens any supported character LCD from a URI or dictionary, importing only the backend
+it uses
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from typing import Any, Dict, Union
+
+    from adafruit_character_lcd.character_lcd import Character_LCD
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+# Module and class for every backend name. Backends are imported by ``open`` so that only the
+# driver libraries for the hardware in use are loaded.
+_BACKENDS = {
+    "parallel": ("character_lcd", "Character_LCD_Mono"),
+    "parallel-rgb": ("character_lcd", "Character_LCD_RGB"),
+    "i2c": ("character_lcd_i2c", "Character_LCD_I2C"),
+    "rgb-i2c": ("character_lcd_rgb_i2c", "Character_LCD_RGB_I2C"),
+    "pcf8574": ("character_lcd_pcf8574", "Character_LCD_PCF8574"),
+    "spi": ("character_lcd_spi", "Character_LCD_SPI"),
+    "gpiod": ("character_lcd_gpiod", "Character_LCD_GPIOD"),
+}
+
+_I2C_BACKENDS = ("i2c", "rgb-i2c", "pcf8574")
+
+# The keyword argument the host part of a URI gives, for backends where it is not the
+# I2C address.
+_HOSTS = {"spi": "latch", "gpiod": "chip"}
+
+# Shorter names accepted in a spec for the keyword arguments of the backends
+_ALIASES = {
+    "cols": "columns",
+    "rows": "lines",
+    "rs": "reset_dio",
+    "en": "enable_dio",
+    "d4": "d4_dio",
+    "d5": "d5_dio",
+    "d6": "d6_dio",
+    "d7": "d7_dio",
+    "backlight": "backlight_pin",
+}
+
+# Keyword arguments that are board pins, and the type each is opened as
+_DIGITAL_PINS = (
+    "reset_dio",
+    "enable_dio",
+    "d4_dio",
+    "d5_dio",
+    "d6_dio",
+    "d7_dio",
+    "backlight_pin",
+    "latch",
+)
+_PWM_PINS = ("red", "green", "blue")
+
+
+def _value(text: str) -> Any:
+    # Converts a query string value to an int or bool where it looks like one.
+    lowered = text.lower()
+    if lowered in {"true", "yes", "on"}:
+        return True
+    if lowered in {"false", "no", "off"}:
+        return False
+    try:
+        return int(text, 0)
+    except ValueError:
+        return text
+
+
+def _parse(spec: str) -> Dict[str, Any]:
+    # Splits "backend://host?key=value&..." into a dictionary.
+    backend, separator, rest = spec.partition("://")
+    if not separator:
+        raise ValueError(f"LCD spec must look like backend://host?options, not {spec!r}")
+    host, _, query = rest.partition("?")
+    config = {"backend": backend}
+    if host:
+        config[_HOSTS.get(backend, "address")] = _value(host)
+    for option in query.split("&"):
+        if option:
+            key, _, value = option.partition("=")
+            config[key] = _value(value)
+    return config
+
+
+def _pin(name: Any, pwm: bool = False) -> Any:
+    # Opens a pin given by its name on ``board``. Anything else is assumed to already be
+    # an opened pin and is passed through.
+    if not isinstance(name, str):
+        return name
+    import board  # noqa: PLC0415
+
+    pin = getattr(board, name)
+    if pwm:
+        import pwmio  # noqa: PLC0415
+
+        return pwmio.PWMOut(pin)
+    import digitalio  # noqa: PLC0415
+
+    return digitalio.DigitalInOut(pin)
+
+
+def open(spec: Union[str, Dict[str, Any]], **kwargs: Any) -> Character_LCD:
+    """Create a character LCD from a URI or dictionary, importing only the module of the
+    backend it names. This keeps startup time and memory use down on boards, and lets a
+    configuration file choose the hardware.
+
+    A URI has the form ``backend://host?option=value&...``. The backend is one of
+    ``i2c``, ``rgb-i2c``, ``pcf8574``, ``spi``, ``parallel``, ``parallel-rgb`` or
+    ``gpiod``. The host is the I2C address for the I2C backends, the latch pin name for
+    ``spi`` and the GPIO chip for ``gpiod``, whose pins are line offsets, as in
+    ``"gpiod://gpiochip0?rs=25&en=24&d4=23&d5=17&d6=18&d7=22&cols=16&rows=2"``.
+
+    Options are the keyword arguments of the backend class, where ``cols`` and ``rows``
+    may be used for ``columns`` and ``lines``, ``rs``, ``en`` and ``d4`` to ``d7`` for
+    the LCD pins and ``backlight`` for the backlight pin. The parallel backends also take
+    a ``read_write`` pin, which is needed to read from the display. Values that look like
+    numbers or booleans are converted.
+
+    A dictionary has the same options with the backend under the ``"backend"`` key.
+    Pins may be given as names on ``board`` or as already opened pins. The I2C and SPI
+    backends use ``board.I2C()`` and ``board.SPI()`` unless an ``i2c`` or ``spi`` bus is
+    given. On Linux, a ``bus`` number for the I2C backends opens that bus with `I2CDev
+    <adafruit_character_lcd.i2c_dev.I2CDev>`, as in ``"rgb-i2c://0x20?bus=1"``.
+    Keyword arguments are added to, and take priority over, those in ``spec``.
+
+    :param str,dict spec: The backend and its options
+    :return: The character LCD
+
+    .. code-block:: python
+
+        import adafruit_character_lcd
+
+        lcd = adafruit_character_lcd.open("i2c://0x20?cols=20&rows=4")
+        lcd.message = "Hello\\nCircuitPython"
+
+    .. code-block:: python
+
+        import board
+        import adafruit_character_lcd
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        lcd = adafruit_character_lcd.open({"backend": "rgb-i2c", "cols": 16, "rows": 2}, i2c=i2c)
+
+        lcd = adafruit_character_lcd.open(
+            "parallel://?rs=D7&en=D8&d4=D9&d5=D10&d6=D11&d7=D12&backlight=D13&cols=16&rows=2"
+        )
+    """
+    config = _parse(spec) if isinstance(spec, str) else dict(spec)
+    config.update(kwargs)
+    backend = config.pop("backend", None)
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown LCD backend {backend!r}, expected one of {sorted(_BACKENDS)}")
+    options = {_ALIASES.get(key, key): value for key, value in config.items()}
+
+    read_write = options.pop("read_write", None)
+    if isinstance(read_write, str):
+        read_write = _pin(read_write)
+        read_write.switch_to_output(value=False)
+    for key in _DIGITAL_PINS:
+        if key in options:
+            options[key] = _pin(options[key])
+    for key in _PWM_PINS:
+        if key in options:
+            options[key] = _pin(options[key], pwm=True)
+    if backend in _I2C_BACKENDS and "bus" in options:
+        from adafruit_character_lcd.i2c_dev import I2CDev  # noqa: PLC0415
+
+        options["i2c"] = I2CDev(options.pop("bus"))
+    elif backend in _I2C_BACKENDS and "i2c" not in options:
+        import board  # noqa: PLC0415
+
+        options["i2c"] = board.I2C()
+    if backend == "spi" and "spi" not in options:
+        import board  # noqa: PLC0415
+
+        options["spi"] = board.SPI()
+
+    module_name, class_name = _BACKENDS[backend]
+    module = __import__("adafruit_character_lcd." + module_name, None, None, (class_name,))
+    if read_write is not None and backend == "parallel-rgb":
+        # Its class takes the pin, so reads the display back when attaching.
+        options["read_write"] = read_write
+        read_write = None
+    lcd = getattr(module, class_name)(**options)
+    if read_write is not None:
+        lcd.read_write = read_write
+        if not options.get("init", True):
+            # The pin was not there for the constructor to read the display back.
+            lcd.load_from_display()
+    return lcd
@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd._fades`
+====================================================
+
+Gamma corrected backlight fades and idle dimming for character LCDs, imported the first
+time a backlight fades or dims
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from typing import List, Optional, Sequence, Union
+
+    from adafruit_character_lcd.character_lcd import Character_LCD_Mono, Character_LCD_RGB
+except ImportError:
+    pass
+
+import array
+import time
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+# RGB backlight duty cycle for each of 256 perceptually even fade steps (gamma 2.2),
+# as 16 bit values. Duty cycles are inverted as the LEDs are driven through their
+# cathodes.
+_FADE_DUTY_CYCLES = array.array(
+    "H", (65535 - int(65535 * (step / 255) ** 2.2 + 0.5) for step in range(256))
+)
+# Fade step with the same brightness as each 0 - 100 color level.
+_FADE_STEPS = bytes(int(255 * (level / 100) ** (1 / 2.2) + 0.5) for level in range(101))
+
+
+def _fade_steps(color: Union[Sequence[float], int]) -> List[int]:
+    # Fade step for each channel of a [R, G, B] list or 0xRRGGBB integer color.
+    if isinstance(color, int):
+        color = (
+            (color >> 16) * 100 // 255,
+            (color >> 8 & 0xFF) * 100 // 255,
+            (color & 0xFF) * 100 // 255,
+        )
+    return [_FADE_STEPS[max(0, min(100, int(level + 0.5)))] for level in color]
+
+
+class Dimming:
+    """Dims the backlight of a monochrome display once it has been idle, as set up by
+    ``dim_when_idle``.
+
+    :param float timeout: Idle seconds before dimming.
+    :param float brightness: Brightness to dim to, from ``0.0`` to ``1.0``.
+    :param float duration: Seconds the ramp down takes.
+    """
+
+    def __init__(self, timeout: float, brightness: float, duration: float) -> None:
+        self.timeout = timeout
+        self.brightness = brightness
+        self.duration = duration
+        # running ramp: start time and the fade steps it starts and ends at
+        self._ramp_start = 0.0
+        self._ramp_from = 0
+        self._ramp_target = None
+        self.wake()
+
+    def wake(self) -> None:
+        """Restart the idle timer, and stop any ramp."""
+        self._wake_time = time.monotonic()
+        self._dimmed = False
+        self._ramp_target = None
+
+    def update(self, lcd: Character_LCD_Mono) -> bool:
+        """Start dimming ``lcd`` once it has been idle for the timeout, and advance the
+        ramp. Returns True while the ramp is running.
+        """
+        now = time.monotonic()
+        if not self._dimmed and lcd._backlight_on and now - self._wake_time >= self.timeout:
+            self._dimmed = True
+            self._ramp_start = now
+            self._ramp_from = _FADE_STEPS[int(lcd._brightness * 100 + 0.5)]
+            self._ramp_target = _FADE_STEPS[int(self.brightness * 100 + 0.5)]
+        if self._ramp_target is None:
+            return False
+        elapsed = now - self._ramp_start
+        if elapsed >= self.duration:
+            self._ramp_target = None
+            lcd._write_backlight(self.brightness)
+            return False
+        progress = int(elapsed * 256 / self.duration)
+        step = self._ramp_from + (((self._ramp_target - self._ramp_from) * progress) >> 8)
+        if lcd._backlight_pwm:
+            # fade steps are inverted, as for RGB backlights driven through the cathode
+            duty_cycle = _FADE_DUTY_CYCLES[step]
+            lcd._set_backlight_output(duty_cycle if lcd.backlight_inverted else 65535 - duty_cycle)
+        return True
+
+
+class Fade:
+    """Fades the backlight of an RGB display through colors, as started by
+    ``fade_sequence``.
+
+    :param Sequence colors: The colors to fade through.
+    :param float duration: Seconds the fade to each color takes.
+    :param bool loop: True to repeat the sequence.
+    :param list at: The fade step of each channel where an interrupted fade left off,
+        or None to start from the color of the display.
+    """
+
+    def __init__(
+        self,
+        colors: Sequence[Union[List[float], int]],
+        duration: float,
+        loop: bool,
+        at: Optional[List[int]],
+    ) -> None:
+        self.colors = colors
+        self.duration = duration
+        self.loop = loop
+        # the color being faded to, the start time, and the fade step each
+        # channel starts from, is currently at and ends at
+        self._index = 0
+        self._start = 0.0
+        self._from = None
+        self.at = at
+        self._target = None
+
+    def start(self, lcd: Character_LCD_RGB, index: int) -> None:
+        """Begin the fade to color ``index``, starting from wherever an interrupted fade
+        left off, or from the color of ``lcd``.
+        """
+        self._index = index
+        self._from = self.at or _fade_steps(lcd._color)
+        self.at = list(self._from)
+        self._target = _fade_steps(self.colors[index])
+        self._start = time.monotonic()
+
+    def update(self, lcd: Character_LCD_RGB) -> bool:
+        """Advance the fade of ``lcd`` to match the time elapsed since it started. Only
+        channels whose duty cycle changes are written. Returns True while the fade is
+        still running.
+        """
+        elapsed = time.monotonic() - self._start
+        if elapsed >= self.duration:
+            index = self._index + 1
+            # land exactly on the color, including any channels without PWM
+            lcd.color = self.colors[self._index]
+            if index == len(self.colors):
+                if not self.loop:
+                    return False
+                index = 0
+            lcd._fade = self
+            self.at = None
+            self.start(lcd, index)
+            return True
+        progress = int(elapsed * 256 / self.duration)
+        target = self._target
+        for number, pin in enumerate(lcd.rgb_led):
+            step = self._from[number]
+            step += ((target[number] - step) * progress) >> 8
+            self.at[number] = step
+            duty_cycle = _FADE_DUTY_CYCLES[step]
+            if lcd._pwm[number] and lcd._outputs[number] != duty_cycle:
+                pin.duty_cycle = duty_cycle
+                lcd._outputs[number] = duty_cycle
+        return True
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd._frames`
+====================================================
+
+Frames of what character LCDs show, written at most at a set rate and with overlays
+over them, imported the first time a frame is kept
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from typing import Optional
+
+    from adafruit_character_lcd.character_lcd import Character_LCD
+except ImportError:
+    pass
+
+import time
+
+from micropython import const
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+# Flags and sizes, as in character_lcd
+_LCD_ENTRYLEFT = const(0x02)
+_LCD_CURSORON = const(0x02)
+_LCD_BLINKON = const(0x01)
+_LCD_DDRAM_SIZE = const(0x68)
+
+
+class Frame:
+    """What a display will show at its next frame, kept while ``max_fps`` is set or
+    overlays are shown.
+
+    :param ~adafruit_character_lcd.character_lcd.Character_LCD lcd: The display, whose
+        characters and address counter the frame starts from.
+    """
+
+    def __init__(self, lcd: Character_LCD) -> None:
+        # the characters by DDRAM address, the address the next character goes
+        # to, and whether the frame differs from the display
+        self.ddram = bytearray(lcd._ddram)
+        self.address = 0 if lcd._address is None else lcd._address
+        self.dirty = False
+        # seconds between frames, 0.0 to write each change straight away, and
+        # when the next frame is due
+        self.interval = 0.0
+        self.due = 0.0
+        # characters overlays show over the frame, by DDRAM address, or None
+        # when no overlay is shown
+        self.cover = None
+
+
+def start_frame(lcd: Character_LCD) -> Frame:
+    # Keep a frame of what the display should show, if not already, and return it.
+    if lcd._frame is None:
+        lcd._frame = Frame(lcd)
+    return lcd._frame
+
+
+def refresh(lcd: Character_LCD) -> None:
+    # Write the characters of the frame, with any overlays over it, that differ
+    # from what the display shows.
+    frame = lcd._frame
+    if frame is None:
+        return
+    frame.dirty = False
+    frame.due = time.monotonic() + frame.interval
+    # Visit cells in the order the address counter moves, so runs of changed
+    # characters are written without setting the address in between.
+    left = lcd.displaymode & _LCD_ENTRYLEFT
+    ddram = frame.ddram
+    cover = frame.cover
+    for step in range(_LCD_DDRAM_SIZE):
+        address = step if left else _LCD_DDRAM_SIZE - 1 - step
+        value = ddram[address] if cover is None else cover.get(address, ddram[address])
+        if value != lcd._ddram[address]:
+            lcd._set_address(address)
+            lcd._write_char(value)
+    # Leave a visible cursor where the next character would have gone.
+    if lcd.displaycontrol & (_LCD_CURSORON | _LCD_BLINKON):
+        lcd._set_address(frame.address)
+
+
+def set_cover(lcd: Character_LCD, cover: Optional[dict]) -> None:
+    # Show ``cover``, characters by DDRAM address, over the frame, writing only
+    # the characters that change. The frame keeps what overlays cover.
+    frame = start_frame(lcd)
+    frame.cover = cover
+    lcd.refresh()
+    if cover is None and not frame.interval:
+        lcd._frame = None
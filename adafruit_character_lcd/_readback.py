@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd._readback`
+====================================================
+
+Reading character LCDs back through their RW line, imported the first time a display
+is read from
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from adafruit_character_lcd.character_lcd import Character_LCD
+except ImportError:
+    pass
+
+import time
+
+import digitalio
+from micropython import const
+
+from adafruit_character_lcd.character_lcd import _LCD_ROW_OFFSETS
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+_LCD_SETCGRAMADDR = const(0x40)
+_LCD_SETDDRAMADDR = const(0x80)
+# Bit of _unsent for display contents that are only assumed, as in character_lcd
+_UNSENT_CLEAR = const(0x04)
+
+
+def read_address_counter(lcd: Character_LCD) -> int:
+    # Read the DDRAM or CGRAM address the next character goes to.
+    buffer = bytearray(1)
+    lcd._read_into(buffer, False)
+    # the top bit is the busy flag
+    return buffer[0] & 0x7F
+
+
+def read_ddram(lcd: Character_LCD, address: int, count: int) -> bytearray:
+    # Read ``count`` characters from DDRAM ``address``.
+    # always set the address: it is what loads the first character to read
+    lcd._send_mode()
+    lcd._write(_LCD_SETDDRAMADDR | address)
+    lcd._cgram_address = None
+    buffer = bytearray(count)
+    lcd._read_into(buffer, True)
+    return buffer
+
+
+def read_cgram(lcd: Character_LCD, address: int, count: int) -> bytearray:
+    # Read ``count`` bytes of custom character patterns from CGRAM ``address``.
+    lcd._send_mode()
+    lcd._write(_LCD_SETCGRAMADDR | (address & 0x3F))
+    lcd._address = None
+    lcd._cgram_address = None
+    buffer = bytearray(count)
+    lcd._read_into(buffer, True)
+    return buffer
+
+
+def repair(lcd: Character_LCD) -> int:
+    # Rewrite the visible characters and created custom characters that differ
+    # from what was last written to them, returning how many were rewritten.
+    repaired = 0
+    for row in range(lcd.lines):
+        start = _LCD_ROW_OFFSETS[row]
+        displayed = read_ddram(lcd, start, lcd.columns)
+        for index in range(lcd.columns):
+            address = start + index
+            if displayed[index] != lcd._ddram[address]:
+                lcd._set_address(address)
+                lcd._write_char(lcd._ddram[address])
+                repaired += 1
+    for location in range(8):
+        if lcd._cgram_loaded & (1 << location):
+            start = location << 3
+            pattern = lcd._cgram[start : start + 8]
+            if read_cgram(lcd, start, 8) != pattern:
+                lcd._cgram_loaded &= ~(1 << location)
+                lcd.create_char(location, pattern)
+                repaired += 1
+    return repaired
+
+
+def load_from_display(lcd: Character_LCD) -> None:
+    # Take what the display shows, and its custom characters, as written to it.
+    for start in (0x00, 0x40):
+        lcd._ddram[start : start + 40] = read_ddram(lcd, start, 40)
+    lcd._cgram[:] = read_cgram(lcd, 0, 64)
+    lcd._cgram_loaded = 0xFF
+    lcd._unsent &= ~_UNSENT_CLEAR
+    if lcd._frame is not None:
+        lcd._frame.ddram[:] = lcd._ddram
+
+
+def read_into(lcd: Character_LCD, buffer: bytearray, char_mode: bool) -> None:
+    # Read len(buffer) bytes in ``char_mode`` into ``buffer`` through the pins of
+    # the display: the busy flag and address counter when ``char_mode`` is False,
+    # or characters when it is True.
+    if lcd.read_write is None:
+        raise RuntimeError("Reading from the display needs a read_write pin")
+    #  one ms delay to let the last write finish.
+    time.sleep(0.001)
+    data_lines = (lcd.dl4, lcd.dl5, lcd.dl6, lcd.dl7)
+    for pin in data_lines:
+        pin.direction = digitalio.Direction.INPUT
+    lcd.reset.value = char_mode
+    lcd.read_write.value = True
+    for index in range(len(buffer)):
+        value = 0
+        # READ upper 4 bits, then lower 4 bits, while enable is high
+        for shift in (4, 0):
+            lcd.enable.value = True
+            time.sleep(0.0000001)
+            for bit, pin in enumerate(data_lines):
+                if pin.value:
+                    value |= 1 << (shift + bit)
+            lcd.enable.value = False
+            time.sleep(0.0000001)
+        buffer[index] = value
+    lcd.read_write.value = False
+    for pin in data_lines:
+        pin.direction = digitalio.Direction.OUTPUT
+    # reading moves the address counter
+    lcd._address = None
+    lcd._cgram_address = None
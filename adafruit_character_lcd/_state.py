@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd._state`
+====================================================
+
+Saving, restoring and resynchronising the state of character LCDs, imported the first
+time it is needed
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from adafruit_character_lcd.character_lcd import Character_LCD
+except ImportError:
+    pass
+
+import time
+
+from micropython import const
+
+from adafruit_character_lcd.character_lcd import _LCD_DDRAM_BLANK
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+# Commands and flags, as in character_lcd
+_LCD_CLEARDISPLAY = const(0x01)
+_LCD_ENTRYMODESET = const(0x04)
+_LCD_DISPLAYCONTROL = const(0x08)
+_LCD_CURSORSHIFT = const(0x10)
+_LCD_FUNCTIONSET = const(0x20)
+_LCD_SETCGRAMADDR = const(0x40)
+_LCD_SETDDRAMADDR = const(0x80)
+_LCD_ENTRYLEFT = const(0x02)
+_LCD_DISPLAYMOVE = const(0x08)
+_LCD_MOVERIGHT = const(0x04)
+_LCD_MOVELEFT = const(0x00)
+_LCD_DDRAM_SIZE = const(0x68)
+
+# State saved by save_state: a version byte, columns, lines, display control,
+# entry mode, function set, display shift, loaded custom characters, both 40
+# character DDRAM rows and the 64 byte CGRAM, followed by any subclass state.
+_STATE_VERSION = const(1)
+_STATE_DDRAM = const(8)
+_STATE_CGRAM = const(88)
+_STATE_SIZE = const(152)
+
+
+def save_state(lcd: Character_LCD) -> bytearray:
+    # Everything written to the display, as described for save_state.
+    extra = lcd._save_extra()
+    state = bytearray(_STATE_SIZE + len(extra))
+    state[0] = _STATE_VERSION
+    state[1] = lcd.columns
+    state[2] = lcd.lines
+    state[3] = lcd.displaycontrol
+    state[4] = lcd.displaymode
+    state[5] = lcd.displayfunction
+    state[6] = lcd._shift % 40
+    state[7] = lcd._cgram_loaded
+    state[_STATE_DDRAM : _STATE_DDRAM + 40] = lcd._ddram[0x00:0x28]
+    state[_STATE_DDRAM + 40 : _STATE_CGRAM] = lcd._ddram[0x40:0x68]
+    state[_STATE_CGRAM:_STATE_SIZE] = lcd._cgram
+    state[_STATE_SIZE:] = extra
+    return state
+
+
+def restore_state(lcd: Character_LCD, state: bytes, shown: bool) -> None:
+    # Restore a state returned by save_state, as described for restore_state.
+    if (
+        len(state) < _STATE_SIZE
+        or state[0] != _STATE_VERSION
+        or state[1] != lcd.columns
+        or state[2] != lcd.lines
+    ):
+        raise ValueError("State was not saved from a display of this size")
+    ddram = bytearray(_LCD_DDRAM_BLANK)
+    ddram[0x00:0x28] = state[_STATE_DDRAM : _STATE_DDRAM + 40]
+    ddram[0x40:0x68] = state[_STATE_DDRAM + 40 : _STATE_CGRAM]
+    if shown:
+        lcd._ddram[:] = ddram
+        lcd._cgram[:] = state[_STATE_CGRAM:_STATE_SIZE]
+        lcd._cgram_loaded = state[7]
+        lcd._shift = state[6]
+        lcd._address = None
+        lcd._cgram_address = None
+        lcd._unsent = 0
+    else:
+        for location in range(8):
+            if state[7] & (1 << location):
+                start = _STATE_CGRAM + (location << 3)
+                lcd.create_char(location, state[start : start + 8])
+        for address in range(_LCD_DDRAM_SIZE):
+            if ddram[address] != lcd._ddram[address]:
+                lcd._set_address(address)
+                lcd._write_char(ddram[address])
+        lcd._shift_by(state[6] - lcd._shift)
+        lcd._set_control(state[3])
+        lcd._set_mode(state[4])
+    lcd.displaycontrol = state[3]
+    lcd.displaymode = state[4]
+    lcd.displayfunction = state[5]
+    if lcd.displaymode & _LCD_ENTRYLEFT:
+        lcd._direction = lcd.LEFT_TO_RIGHT
+    else:
+        lcd._direction = lcd.RIGHT_TO_LEFT
+    if lcd._frame is not None:
+        lcd._frame.ddram[:] = lcd._ddram
+    lcd._restore_extra(state[_STATE_SIZE:])
+
+
+def resync(lcd: Character_LCD) -> None:
+    # Reinitialise the display and write back everything the driver shadows.
+    lcd._reinit_pins()
+    lcd._wake()
+    write8 = lcd._write8
+    write8(_LCD_FUNCTIONSET | lcd.displayfunction)
+    write8(_LCD_DISPLAYCONTROL | lcd.displaycontrol)
+    write8(_LCD_CLEARDISPLAY)
+    time.sleep(0.003)
+    # Clearing left the address counter incrementing from 0x00, so only the
+    # characters that are not blank need to be written again.
+    write8(_LCD_ENTRYMODESET | lcd.displaymode | _LCD_ENTRYLEFT)
+    ddram = lcd._ddram
+    next_address = 0
+    for address in range(_LCD_DDRAM_SIZE):
+        if ddram[address] != 0x20:
+            if address != next_address:
+                write8(_LCD_SETDDRAMADDR | address)
+            write8(ddram[address], True)
+            next_address = address + 1
+    write8(_LCD_ENTRYMODESET | lcd.displaymode)
+    for location in range(8):
+        if lcd._cgram_loaded & (1 << location):
+            write8(_LCD_SETCGRAMADDR | (location << 3))
+            for i in range(location << 3, (location << 3) + 8):
+                write8(lcd._cgram[i], True)
+    # Shift the display back into place by the shortest way round its 40 columns.
+    shift = lcd._shift % 40
+    if shift <= 20:
+        for _ in range(shift):
+            write8(_LCD_CURSORSHIFT | _LCD_DISPLAYMOVE | _LCD_MOVERIGHT)
+    else:
+        for _ in range(40 - shift):
+            write8(_LCD_CURSORSHIFT | _LCD_DISPLAYMOVE | _LCD_MOVELEFT)
+    if lcd._cgram_address is not None:
+        write8(_LCD_SETCGRAMADDR | lcd._cgram_address)
+    elif lcd._address is not None:
+        write8(_LCD_SETDDRAMADDR | lcd._address)
+    lcd._unsent = 0
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd.big_digits`
+====================================================
+
+Large numbers, two or four rows tall, built from custom characters on character LCDs
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from typing import Dict, Tuple
+
+    from adafruit_character_lcd.character_lcd import Character_LCD
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+# Segment glyphs shared by both fonts: rounded corners, upper and lower bars, and
+# upper and lower bars with half of a middle bar.
+_GLYPHS = (
+    bytes((0x07, 0x0F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F)),  # a: left top
+    bytes((0x1F, 0x1F, 0x1F, 0x00, 0x00, 0x00, 0x00, 0x00)),  # b: upper bar
+    bytes((0x1C, 0x1E, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F)),  # c: right top
+    bytes((0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x0F, 0x07)),  # d: left bottom
+    bytes((0x00, 0x00, 0x00, 0x00, 0x00, 0x1F, 0x1F, 0x1F)),  # e: lower bar
+    bytes((0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1E, 0x1C)),  # f: right bottom
+    bytes((0x1F, 0x1F, 0x1F, 0x00, 0x00, 0x00, 0x1F, 0x1F)),  # g: upper and middle bars
+    bytes((0x1F, 0x00, 0x00, 0x00, 0x00, 0x1F, 0x1F, 0x1F)),  # h: middle and lower bars
+)
+
+# Cell maps for each character, one string per row, using the glyph letters above,
+# "#" for a filled cell and "." for the center dot.
+_FONT_2 = {
+    "0": ("abc", "def"),
+    "1": ("bc ", "e#e"),
+    "2": ("ggc", "dee"),
+    "3": ("ggc", "hhf"),
+    "4": ("de#", "  #"),
+    "5": ("dgg", "hhf"),
+    "6": ("agg", "dhf"),
+    "7": ("bbc", "  #"),
+    "8": ("agc", "dhf"),
+    "9": ("agc", "  #"),
+    "-": ("   ", "bbb"),
+    " ": ("   ", "   "),
+    ":": (".", "."),
+}
+_FONT_4 = {
+    "0": ("abc", "# #", "# #", "def"),
+    "1": ("b# ", " # ", " # ", "e#e"),
+    "2": ("bbc", "ee#", "#bb", "dee"),
+    "3": ("bbc", "ee#", "bb#", "eef"),
+    "4": ("# #", "#e#", "bb#", "  #"),
+    "5": ("#bb", "#ee", "bb#", "eef"),
+    "6": ("abb", "#ee", "#b#", "def"),
+    "7": ("bbc", "  #", "  #", "  #"),
+    "8": ("abc", "#e#", "#b#", "def"),
+    "9": ("abc", "#e#", "bb#", "eef"),
+    "-": ("   ", "eee", "bbb", "   "),
+    " ": ("   ", "   ", "   ", "   "),
+    ":": (" ", ".", ".", " "),
+}
+# The ROM characters for a filled cell and a center dot.
+_ROM_CELLS = {"#": "\xff", ".": "\xa5", " ": " "}
+
+
+class BigNumber:
+    """Large digits, two or four rows tall, for numbers that need to be read from across
+    a room. Shows digits, ``-``, ``:`` and spaces. Digits are three columns wide and
+    separated by a blank column; colons are one column wide.
+
+    The eight segment glyphs are loaded into the custom characters once, and the cells
+    of every character are worked out up front. Setting new `text` only redraws the
+    characters that changed, so a clock ticking once a second updates one or two digits.
+
+    The following example shows a clock on a 20x4 display.
+
+    .. code-block:: python
+
+        import time
+        import board
+        import adafruit_character_lcd.character_lcd_i2c as character_lcd
+        from adafruit_character_lcd.big_digits import BigNumber
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        lcd = character_lcd.Character_LCD_I2C(i2c, 20, 4)
+
+        clock = BigNumber(lcd, height=4)
+        while True:
+            now = time.localtime()
+            clock.text = "{:02d}:{:02d}".format(now.tm_hour, now.tm_min)
+            time.sleep(1)
+
+    :param ~adafruit_character_lcd.character_lcd.Character_LCD lcd: The display to draw on.
+    :param int column: The column the number starts at.
+    :param int row: The top row of the number.
+    :param int height: The number of rows the digits are tall, 2 or 4.
+    """
+
+    def __init__(self, lcd: Character_LCD, column: int = 0, row: int = 0, height: int = 2) -> None:
+        if height not in {2, 4}:
+            raise ValueError("height must be 2 or 4")
+        self._lcd = lcd
+        self._column = column
+        self._row = row
+        self._text = ""
+        # (column, character) of each character drawn, and the column after the last
+        self._drawn = []
+        self._end = column
+        for slot, glyph in enumerate(_GLYPHS):
+            lcd.create_char(slot, glyph)
+        self._font = self._build_font(_FONT_2 if height == 2 else _FONT_4)
+
+    @staticmethod
+    def _build_font(cell_maps: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[str, ...]]:
+        # Turn the cell maps into the characters to write for each row, each followed
+        # by the blank column that separates it from the next character.
+        font = {}
+        for character, rows in cell_maps.items():
+            font[character] = tuple(
+                "".join(_ROM_CELLS.get(cell) or chr(ord(cell) - ord("a")) for cell in cells) + " "
+                for cells in rows
+            )
+        return font
+
+    @property
+    def text(self) -> str:
+        """The digits shown, such as ``"12:34"`` or ``"-42"``."""
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        column = self._column
+        drawn = []
+        for index, character in enumerate(text):
+            rows = self._font.get(character)
+            if rows is None:
+                raise ValueError(f"{character!r} cannot be shown in big digits")
+            if index >= len(self._drawn) or self._drawn[index] != (column, character):
+                for line, cells in enumerate(rows):
+                    self._lcd.write_at(column, self._row + line, cells)
+            drawn.append((column, character))
+            column += len(rows[0])
+        # blank whatever is left of longer text
+        if self._end > column:
+            blank = " " * (self._end - column)
+            for line in range(len(self._font[" "])):
+                self._lcd.write_at(column, self._row + line, blank)
+        self._text = text
+        self._drawn = drawn
+        self._end = column
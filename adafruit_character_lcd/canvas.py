@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd.canvas`
+====================================================
+
+Text larger than character LCDs, scrolled through a viewport the size of the display
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from adafruit_character_lcd.character_lcd import Character_LCD
+except ImportError:
+    pass
+
+from adafruit_character_lcd.character_lcd import _LCD_ROW_OFFSETS
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+
+class Canvas:
+    """Rows of text of any size, such as a long menu or log, with a viewport showing the
+    part of them that fits on the display. Text is written to the canvas once, and
+    moving the viewport shows another part of it:
+
+    * Scrolling up or down writes only the characters of the display that change.
+    * Scrolling sideways on a display of 1 or 2 rows, with a canvas no wider than the 40
+      characters the display holds in each row, keeps every column of the visible rows in
+      the display and moves them with the display shift, one command per column, as
+      `move_left <adafruit_character_lcd.character_lcd.Character_LCD.move_left>` does.
+    * Otherwise, scrolling sideways writes the characters that change.
+
+    The canvas takes over the display: write to it, rather than with ``message`` or
+    ``write_at``, while it is in use.
+
+    The following example scrolls through a menu with the keypad of an RGB LCD shield.
+
+    .. code-block:: python
+
+        import board
+        import adafruit_character_lcd.character_lcd_rgb_i2c as character_lcd
+        from adafruit_character_lcd.canvas import Canvas
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        lcd = character_lcd.Character_LCD_RGB_I2C(i2c, 16, 2)
+
+        items = ["Brightness", "Contrast", "Network settings", "Restart", "About"]
+        canvas = Canvas(lcd, 20, len(items))
+        for row, item in enumerate(items):
+            canvas.write(0, row, item)
+        while True:
+            if lcd.down_button:
+                canvas.scroll(0, 1)
+            elif lcd.up_button:
+                canvas.scroll(0, -1)
+
+    :param ~adafruit_character_lcd.character_lcd.Character_LCD lcd: The display to show
+        the canvas on.
+    :param int columns: The columns of the canvas.
+    :param int rows: The rows of the canvas.
+    """
+
+    def __init__(self, lcd: Character_LCD, columns: int, rows: int) -> None:
+        self._lcd = lcd
+        self.columns = columns
+        self.rows = rows
+        self._text = [bytearray(b" " * columns) for _ in range(rows)]
+        # The canvas column and row at the top left of the display
+        self._left = 0
+        self._top = 0
+        # Whether every column of the visible rows fits in the display, so that
+        # scrolling sideways can shift the display.
+        self._shifting = lcd.lines <= 2 and columns <= 40
+        if self._shifting:
+            lcd._shift_by(-lcd._shift)
+        self._show()
+
+    @property
+    def left(self) -> int:
+        """The column of the canvas shown in the first column of the display."""
+        return self._left
+
+    @left.setter
+    def left(self, column: int) -> None:
+        self.scroll_to(column, self._top)
+
+    @property
+    def top(self) -> int:
+        """The row of the canvas shown in the first row of the display."""
+        return self._top
+
+    @top.setter
+    def top(self, row: int) -> None:
+        self.scroll_to(self._left, row)
+
+    def scroll_to(self, column: int, row: int) -> None:
+        """Move the viewport so that ``column`` and ``row`` of the canvas are shown at the
+        top left of the display. The viewport stops at the edges of the canvas.
+
+        :param int column: The column of the canvas to show first.
+        :param int row: The row of the canvas to show first.
+        """
+        lcd = self._lcd
+        column = max(0, min(column, self.columns - lcd.columns))
+        row = max(0, min(row, self.rows - lcd.lines))
+        moved = column != self._left
+        scrolled = row != self._top
+        self._left = column
+        self._top = row
+        if moved and self._shifting:
+            lcd._shift_by(-column - lcd._shift)
+            moved = False
+        if moved or scrolled:
+            self._show()
+
+    def scroll(self, columns: int = 0, rows: int = 0) -> None:
+        """Move the viewport by ``columns`` to the right and ``rows`` down, or left and up
+        when negative.
+
+        :param int columns: The columns to move by.
+        :param int rows: The rows to move by.
+        """
+        self.scroll_to(self._left + columns, self._top + rows)
+
+    def write(self, column: int, row: int, text: str) -> None:
+        """Write ``text`` on ``row`` of the canvas starting at ``column``. Text is written
+        on a single row and is cut off at the last column of the canvas. Only characters
+        that change on the display are sent to it.
+
+        :param int column: The column of the canvas to start at.
+        :param int row: The row of the canvas to write to.
+        :param str text: The text to write.
+        """
+        line = self._text[row]
+        for index in range(min(len(text), self.columns - column)):
+            line[column + index] = ord(text[index]) & 0xFF
+        if self._top <= row < self._top + self._lcd.lines:
+            self._show_row(row - self._top)
+
+    def read(self, row: int) -> str:
+        """The text on ``row`` of the canvas.
+
+        :param int row: The row of the canvas.
+        """
+        return "".join(chr(code) for code in self._text[row])
+
+    def clear(self) -> None:
+        """Blank the canvas."""
+        for line in self._text:
+            line[:] = b" " * self.columns
+        self._show()
+
+    def _show(self) -> None:
+        for row in range(min(self._lcd.lines, self.rows)):
+            self._show_row(row)
+
+    def _show_row(self, row: int) -> None:
+        # Show the canvas row in the viewport on ``row`` of the display: all of it
+        # when shifting, or only what fits on the display otherwise.
+        line = self._text[self._top + row]
+        if self._shifting:
+            self._lcd._write_ddram(_LCD_ROW_OFFSETS[row], line)
+        else:
+            end = min(self._left + self._lcd.columns, self.columns)
+            self._lcd._write_ddram(_LCD_ROW_OFFSETS[row], line, self._left, end)
@@ -33,7 +33,7 @@ Implementation Notes
 try:
     from typing import List, Optional, Sequence, Union
 
-    from circuitpython_typing import pwmio
+    from circuitpython_typing import ReadableBuffer, pwmio
 except ImportError:
     pass
 
@@ -80,6 +80,23 @@ _LCD_5X8DOTS = const(0x00)
 # Offset for up to 4 rows.
 _LCD_ROW_OFFSETS = (0x00, 0x40, 0x14, 0x54)
 
+# DDRAM size in 2 line mode (0x00 - 0x27 and 0x40 - 0x67), and its cleared contents.
+_LCD_DDRAM_SIZE = const(0x68)
+_LCD_DDRAM_BLANK = b" " * _LCD_DDRAM_SIZE
+
+# Bits of _unsent: registers that may not hold what their shadow says, after
+# attaching to a display that was already initialised.
+_UNSENT_CONTROL = const(0x01)
+_UNSENT_MODE = const(0x02)
+# What the display shows and its shift, known again once it is cleared or read back.
+_UNSENT_CLEAR = const(0x04)
+
+# Data line levels (d4, d5, d6, d7) for every 4 bit nibble.
+_NIBBLE_LEVELS = tuple((bool(n & 1), bool(n & 2), bool(n & 4), bool(n & 8)) for n in range(16))
+
+# Offset of the RS=1 half of a port lookup table.
+_PORT_TABLE_RS = const(16)
+
 
 def _set_bit(byte_value: int, position: int, val: bool) -> int:
     # Given the specified byte_value set the bit at position to the provided
@@ -92,16 +109,43 @@ def _set_bit(byte_value: int, position: int, val: bool) -> int:
     return ret
 
 
-def _map(xval: float, in_min: float, in_max: float, out_min: float, out_max: float) -> float:
-    # Affine transfer/map with constrained output.
-    outrange = float(out_max - out_min)
-    inrange = float(in_max - in_min)
-    ret = (xval - in_min) * (outrange / inrange) + out_min
-    if out_max > out_min:
-        ret = max(min(ret, out_max), out_min)
-    else:
-        ret = max(min(ret, out_min), out_max)
-    return ret
+def _port_table(rs_bit: int, d4_bit: int, d5_bit: int, d6_bit: int, d7_bit: int) -> bytearray:
+    # Build the lookup used by backends that drive every LCD line from one 8 bit
+    # port. Entry ``nibble`` holds the nibble already shifted onto the data pins.
+    # The second half of the table (from _PORT_TABLE_RS) holds the same words with
+    # RS set.
+    table = bytearray(2 * _PORT_TABLE_RS)
+    for nibble in range(16):
+        for position, bit in enumerate((d4_bit, d5_bit, d6_bit, d7_bit)):
+            if nibble & (1 << position):
+                table[nibble] |= 1 << bit
+        table[_PORT_TABLE_RS + nibble] = table[nibble] | (1 << rs_bit)
+    return table
+
+
+def _encode8(
+    buffer: bytearray, table: bytearray, value: int, char_mode: bool, extra: int, enable: int
+) -> None:
+    # Fill the six entry ``buffer`` with the port words that clock ``value`` into
+    # the LCD: each nibble is set up, latched with enable high, then held.
+    rs = _PORT_TABLE_RS if char_mode else 0
+    high = table[rs | value >> 4 & 0x0F] | extra
+    low = table[rs | value & 0x0F] | extra
+    buffer[0] = high
+    buffer[1] = high | enable
+    buffer[2] = high
+    buffer[3] = low
+    buffer[4] = low | enable
+    buffer[5] = low
+
+
+def _duty_cycle(level: float) -> int:
+    # Inverted 16 bit duty cycle for a 0 - 100 color level, clamped to that range.
+    if level <= 0:
+        return 65535
+    if level >= 100:
+        return 0
+    return 65535 - int(level * 65535) // 100
 
 
 class Character_LCD:
@@ -115,12 +159,24 @@ class Character_LCD:
     :param ~digitalio.DigitalInOut d7_dio: The data line 7
     :param int columns: The columns on the charLCD
     :param int lines: The lines on the charLCD
+    :param bool init: ``True`` to initialise and clear the display. ``False`` to attach to a
+        display that is already initialised, for example by an earlier run of the program,
+        without clearing it. See `load_from_display`.
 
     """
 
     LEFT_TO_RIGHT = const(0)
     RIGHT_TO_LEFT = const(1)
 
+    # The rw pin, needed to read from the display. Set by subclasses that have one.
+    read_write = None
+
+    #: Times a write that fails with ``OSError`` is retried, each time after resynchronising
+    #: the display with `resync`, before the error is raised. ``0`` raises errors straight away.
+    retries = 3
+    #: Seconds to wait before the first retry. Each retry waits twice as long as the last.
+    retry_delay = 0.01
+
     def __init__(
         self,
         reset_dio: digitalio.DigitalInOut,
@@ -131,6 +187,7 @@ class Character_LCD:
         d7_dio: digitalio.DigitalInOut,
         columns: int,
         lines: int,
+        init: bool = True,
     ) -> None:
         self.columns = columns
         self.lines = lines
@@ -146,35 +203,67 @@ class Character_LCD:
         for pin in (reset_dio, enable_dio, d4_dio, d5_dio, d6_dio, d7_dio):
             pin.direction = digitalio.Direction.OUTPUT
 
-        # Initialise the display
-        self._write8(0x33)
-        self._write8(0x32)
+        # Shadow of the display data RAM, and the address counter within it. The
+        # address is None when unknown, or while the counter points into CGRAM.
+        self._ddram = bytearray(_LCD_DDRAM_BLANK)
+        self._address = None
+        # The next CGRAM address while the address counter points into CGRAM.
+        self._cgram_address = None
+        # Columns the display has been shifted right by.
+        self._shift = 0
+        # Shadow of the 8 custom character patterns, and a bit for each one that
+        # has been written since the display was initialised.
+        self._cgram = bytearray(64)
+        self._cgram_loaded = 0
+        # What the display will show at the next frame, while max_fps is set or
+        # overlays are shown.
+        self._frame = None
+
         # Initialise display control
         self.displaycontrol = _LCD_DISPLAYON | _LCD_CURSOROFF | _LCD_BLINKOFF
         # Initialise display function
         self.displayfunction = _LCD_4BITMODE | _LCD_1LINE | _LCD_2LINE | _LCD_5X8DOTS
         # Initialise display mode
         self.displaymode = _LCD_ENTRYLEFT | _LCD_ENTRYSHIFTDECREMENT
-        # Write to displaycontrol
-        self._write8(_LCD_DISPLAYCONTROL | self.displaycontrol)
-        # Write to displayfunction
-        self._write8(_LCD_FUNCTIONSET | self.displayfunction)
-        # Set entry mode
-        self._write8(_LCD_ENTRYMODESET | self.displaymode)
-        self.clear()
+        # The display control and entry mode of an attached display cannot be read
+        # back, so they are sent the first time they are set, whatever they are.
+        self._unsent = 0 if init else _UNSENT_CONTROL | _UNSENT_MODE | _UNSENT_CLEAR
+        if init:
+            # Initialise the display
+            self._wake()
+            # Write to displaycontrol
+            self._write8(_LCD_DISPLAYCONTROL | self.displaycontrol)
+            # Write to displayfunction
+            self._write8(_LCD_FUNCTIONSET | self.displayfunction)
+            # Set entry mode
+            self._write8(_LCD_ENTRYMODESET | self.displaymode)
+            self.clear()
+        elif self.read_write is not None:
+            # Attaching: the display keeps what it shows, so read that back
+            # rather than assume it is blank.
+            self.load_from_display()
 
         self._message = ""
-        self._backlight_on = False
         self._direction = self.LEFT_TO_RIGHT
         # track row and column used in cursor_position
         # initialize to 0,0
         self.row = 0
         self.column = 0
         self._column_align = False
+        self._fields = None
+        self._overlays = None
 
     def home(self) -> None:
         """Moves the cursor "home" to position (0, 0)."""
-        self._write8(_LCD_RETURNHOME)
+        if self._frame is not None:
+            self._frame.address = 0
+        # nothing to do if the cursor is home and the display is known not to be shifted
+        if self._address == 0 and not self._shift and not self._unsent & _UNSENT_CLEAR:
+            return
+        self._write(_LCD_RETURNHOME)
+        self._address = 0
+        self._cgram_address = None
+        self._shift = 0
         time.sleep(0.003)
 
     def clear(self) -> None:
@@ -194,9 +283,43 @@ class Character_LCD:
             lcd.message = "Hello, world!"
             time.sleep(5)
             lcd.clear()
+
+        With `max_fps` set, this blanks the frame instead, and the next frame writes
+        spaces over only the characters that were shown.
         """
-        self._write8(_LCD_CLEARDISPLAY)
+        unknown = self._unsent & _UNSENT_CLEAR
+        if self._frame is not None:
+            # Blank the frame, and let the next one write only what was shown.
+            self._frame.ddram[:] = _LCD_DDRAM_BLANK
+            self._frame.address = 0
+            if not unknown:
+                self._schedule()
+                return
+        # nothing to do if the display is known to be blank, with the cursor home,
+        # the display not shifted and text left to right, as clearing leaves it
+        elif (
+            not unknown
+            and self._address == 0
+            and not self._shift
+            and self.displaymode & _LCD_ENTRYLEFT
+            and self._ddram == _LCD_DDRAM_BLANK
+        ):
+            return
+        self._write(_LCD_CLEARDISPLAY)
+        self._unsent &= ~_UNSENT_CLEAR
+        self._ddram[:] = _LCD_DDRAM_BLANK
+        self._address = 0
+        self._cgram_address = None
+        self._shift = 0
         time.sleep(0.003)
+        # Clearing also sets text left to right: set the entry mode back if the
+        # text direction is right to left.
+        mode = self.displaymode
+        self.displaymode |= _LCD_ENTRYLEFT
+        self._set_mode(mode)
+        if self._frame is not None:
+            # write back any overlays the clear took off
+            self._schedule()
 
     @property
     def column_align(self) -> bool:
@@ -237,10 +360,9 @@ class Character_LCD:
     @cursor.setter
     def cursor(self, show: bool) -> None:
         if show:
-            self.displaycontrol |= _LCD_CURSORON
+            self._set_control(self.displaycontrol | _LCD_CURSORON)
         else:
-            self.displaycontrol &= ~_LCD_CURSORON
-        self._write8(_LCD_DISPLAYCONTROL | self.displaycontrol)
+            self._set_control(self.displaycontrol & ~_LCD_CURSORON)
 
     def cursor_position(self, column: int, row: int) -> None:
         """Move the cursor to position ``column``, ``row`` for the next
@@ -256,7 +378,10 @@ class Character_LCD:
         if column >= self.columns:
             column = self.columns - 1
         # Set location
-        self._write8(_LCD_SETDDRAMADDR | (column + _LCD_ROW_OFFSETS[row]))
+        if self._frame is None:
+            self._set_address(column + _LCD_ROW_OFFSETS[row])
+        else:
+            self._frame.address = column + _LCD_ROW_OFFSETS[row]
         # Update self.row and self.column to match setter
         self.row = row
         self.column = column
@@ -287,10 +412,9 @@ class Character_LCD:
     @blink.setter
     def blink(self, blink: bool) -> None:
         if blink:
-            self.displaycontrol |= _LCD_BLINKON
+            self._set_control(self.displaycontrol | _LCD_BLINKON)
         else:
-            self.displaycontrol &= ~_LCD_BLINKON
-        self._write8(_LCD_DISPLAYCONTROL | self.displaycontrol)
+            self._set_control(self.displaycontrol & ~_LCD_BLINKON)
 
     @property
     def display(self) -> bool:
@@ -317,10 +441,9 @@ class Character_LCD:
     @display.setter
     def display(self, enable: bool) -> None:
         if enable:
-            self.displaycontrol |= _LCD_DISPLAYON
+            self._set_control(self.displaycontrol | _LCD_DISPLAYON)
         else:
-            self.displaycontrol &= ~_LCD_DISPLAYON
-        self._write8(_LCD_DISPLAYCONTROL | self.displaycontrol)
+            self._set_control(self.displaycontrol & ~_LCD_DISPLAYON)
 
     @property
     def message(self) -> Optional[str]:
@@ -349,6 +472,10 @@ class Character_LCD:
 
     @message.setter
     def message(self, message: str):
+        self._show_message(message)
+
+    def _show_message(self, message: str) -> None:
+        # Show ``message`` as described for the message property.
         self._message = message
         # Set line to match self.row from cursor_position()
         line = self.row
@@ -384,10 +511,153 @@ class Character_LCD:
                     col = self.columns - 1
                 self.cursor_position(col, line)
             # Write string to display
+            elif self._frame is None:
+                self._write_char(ord(character) & 0xFF)
             else:
-                self._write8(ord(character), True)
+                frame = self._frame
+                frame.ddram[frame.address] = ord(character) & 0xFF
+                frame.address = self._next_address(frame.address)
         # reset column and row to (0,0) after message is displayed
         self.column, self.row = 0, 0
+        if self._frame is not None:
+            self._schedule()
+
+    def write_at(self, column: int, row: int, text: str) -> None:
+        """Show ``text`` on ``row`` starting at ``column``, sending only the characters
+        that differ from what is already displayed. Text is written on a single row and
+        is cut off at the last column. Unlike `message`, this does not use or reset the
+        position set by `cursor_position`.
+
+        The following example shows a counter without redrawing its label.
+
+        .. code-block:: python
+
+            import board
+            import adafruit_character_lcd.character_lcd_i2c as character_lcd
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+            lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2)
+
+            lcd.message = "Count:"
+            count = 0
+            while True:
+                lcd.write_at(7, 0, str(count))
+                count += 1
+
+        :param int column: column location
+        :param int row: row location
+        :param str text: the text to show
+        """
+        # Clamp row to the last row of the display
+        if row >= self.lines:
+            row = self.lines - 1
+        self._write_ddram(column + _LCD_ROW_OFFSETS[row], text[: max(self.columns - column, 0)])
+
+    def write_bytes(self, buffer: ReadableBuffer, column: int = 0, row: int = 0) -> None:
+        """Show the character codes in ``buffer`` on ``row`` starting at ``column``, sending
+        only the characters that differ from what is already displayed, as `write_at`
+        does. ``buffer`` may be any buffer of bytes, such as a ``bytes``, ``bytearray`` or
+        ``memoryview``, and is read in place. No objects are created, so a display
+        refreshed from buffers that are kept and reused never needs the garbage
+        collector, and never makes a control loop wait for it.
+
+        A newline byte (10) continues on the next row, at ``column``. Each row is cut off
+        at the last column, and rows past the last row are left out.
+
+        The following example shows a reading without creating a string each time.
+
+        .. code-block:: python
+
+            import board
+            import analogio
+            import adafruit_character_lcd.character_lcd_i2c as character_lcd
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+            lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2)
+            sensor = analogio.AnalogIn(board.A0)
+
+            lcd.message = "Reading:"
+            digits = bytearray(5)
+            while True:
+                value = sensor.value
+                for index in range(4, -1, -1):
+                    digits[index] = 48 + value % 10
+                    value //= 10
+                lcd.write_bytes(digits, 9, 0)
+
+        :param ReadableBuffer buffer: The character codes to show.
+        :param int column: column location
+        :param int row: row location
+        """
+        end = len(buffer)
+        start = 0
+        while start < end and row < self.lines:
+            stop = start
+            while stop < end and buffer[stop] != 10:
+                stop += 1
+            count = min(stop - start, self.columns - column)
+            if count > 0:
+                self._write_ddram(column + _LCD_ROW_OFFSETS[row], buffer, start, start + count)
+            start = stop + 1
+            row += 1
+
+    @property
+    def fields(self) -> "Fields":
+        """Named, fixed-width fields of the display that update in place when assigned
+        a value. See `adafruit_character_lcd.fields.Fields`.
+
+        The following example shows a counter in a right aligned field.
+
+        .. code-block:: python
+
+            import board
+            import adafruit_character_lcd.character_lcd_i2c as character_lcd
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+            lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2)
+
+            lcd.message = "Count:"
+            lcd.fields.add("count", 7, 0, 9, align=">")
+            count = 0
+            while True:
+                lcd.fields["count"] = count
+                count += 1
+        """
+        if self._fields is None:
+            # only load fields for applications that use them
+            from adafruit_character_lcd.fields import Fields  # noqa: PLC0415
+
+            self._fields = Fields(self)
+        return self._fields
+
+    @property
+    def overlays(self) -> "Overlays":
+        """Timed messages, such as alerts, shown over whatever is written to the display
+        and taken down again without redrawing it. See
+        `adafruit_character_lcd.overlays.Overlays`.
+
+        The following example shows an alert for 3 seconds over a clock.
+
+        .. code-block:: python
+
+            import time
+            import board
+            import adafruit_character_lcd.character_lcd_i2c as character_lcd
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+            lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2)
+
+            lcd.overlays.show("Door open!", 3, 1, duration=3)
+            while True:
+                lcd.write_at(4, 0, "{:02d}:{:02d}:{:02d}".format(*time.localtime()[3:6]))
+                lcd.update()
+        """
+        if self._overlays is None:
+            # only load overlays for applications that use them
+            from adafruit_character_lcd.overlays import Overlays  # noqa: PLC0415
+
+            self._overlays = Overlays(self)
+        return self._overlays
 
     def move_left(self) -> None:
         """Moves displayed text left one column.
@@ -410,7 +680,8 @@ class Character_LCD:
                 lcd.move_left()
                 time.sleep(0.5)
         """
-        self._write8(_LCD_CURSORSHIFT | _LCD_DISPLAYMOVE | _LCD_MOVELEFT)
+        self._write(_LCD_CURSORSHIFT | _LCD_DISPLAYMOVE | _LCD_MOVELEFT)
+        self._shift -= 1
 
     def move_right(self) -> None:
         """Moves displayed text right one column.
@@ -433,7 +704,8 @@ class Character_LCD:
                 lcd.move_right()
                 time.sleep(0.5)
         """
-        self._write8(_LCD_CURSORSHIFT | _LCD_DISPLAYMOVE | _LCD_MOVERIGHT)
+        self._write(_LCD_CURSORSHIFT | _LCD_DISPLAYMOVE | _LCD_MOVERIGHT)
+        self._shift += 1
 
     @property
     def text_direction(self) -> Optional[int]:
@@ -469,13 +741,11 @@ class Character_LCD:
 
     def _left_to_right(self) -> None:
         # Displays text from left to right on the LCD.
-        self.displaymode |= _LCD_ENTRYLEFT
-        self._write8(_LCD_ENTRYMODESET | self.displaymode)
+        self._set_mode(self.displaymode | _LCD_ENTRYLEFT)
 
     def _right_to_left(self) -> None:
         # Displays text from right to left on the LCD.
-        self.displaymode &= ~_LCD_ENTRYLEFT
-        self._write8(_LCD_ENTRYMODESET | self.displaymode)
+        self._set_mode(self.displaymode & ~_LCD_ENTRYLEFT)
 
     def create_char(self, location: int, pattern: Sequence[int]) -> None:
         """
@@ -491,9 +761,404 @@ class Character_LCD:
         """
         # only position 0..7 are allowed
         location &= 0x7
-        self._write8(_LCD_SETCGRAMADDR | (location << 3))
+        start = location << 3
+        # nothing to do if the character already has this pattern
+        if self._cgram_loaded & (1 << location):
+            for i in range(8):
+                if self._cgram[start + i] != pattern[i]:
+                    break
+            else:
+                return
+        # the address counter is already there after creating the character before,
+        # unless writing right to left moves it backwards
+        if (
+            self._cgram_address != start
+            or not self.displaymode & _LCD_ENTRYLEFT
+            or self._unsent & _UNSENT_MODE
+        ):
+            self._send_mode()
+            self._write(_LCD_SETCGRAMADDR | start)
+        self._address = None
+        self._cgram_address = start
+        self._cgram_loaded |= 1 << location
         for i in range(8):
-            self._write8(pattern[i], char_mode=True)
+            self._write(pattern[i], char_mode=True)
+            self._cgram[start + i] = pattern[i]
+            self._cgram_address = start + i + 1
+
+    def read_address_counter(self) -> int:
+        """Read the address counter of the display: where the next character will be
+        written to or read from. Needs a ``read_write`` pin.
+
+        :return: The DDRAM or CGRAM address.
+        """
+        from adafruit_character_lcd._readback import read_address_counter  # noqa: PLC0415
+
+        return read_address_counter(self)
+
+    def read_ddram(self, address: int, count: int) -> bytearray:
+        """Read characters back from the display data RAM. Row ``n`` of the display starts
+        at address ``(0x00, 0x40, 0x14, 0x54)[n]``. Needs a ``read_write`` pin.
+
+        :param int address: DDRAM address to start reading at.
+        :param int count: The number of characters to read.
+        :return: The characters read.
+        """
+        from adafruit_character_lcd._readback import read_ddram  # noqa: PLC0415
+
+        return read_ddram(self, address, count)
+
+    def read_cgram(self, address: int, count: int) -> bytearray:
+        """Read custom character patterns back from the character generator RAM. Custom
+        character ``n`` is the 8 bytes starting at address ``n * 8``. Needs a ``read_write``
+        pin.
+
+        :param int address: CGRAM address to start reading at, 0 - 63.
+        :param int count: The number of bytes to read.
+        :return: The bytes read.
+        """
+        from adafruit_character_lcd._readback import read_cgram  # noqa: PLC0415
+
+        return read_cgram(self, address, count)
+
+    def repair(self) -> int:
+        """Read back the visible characters and the custom characters created with
+        `create_char`, and rewrite any that differ from what was last written to them,
+        for example after electrical noise or a brownout has corrupted the display. Needs
+        a ``read_write`` pin.
+
+        The following example checks the display once a minute.
+
+        .. code-block:: python
+
+            import time
+            import board
+            import adafruit_character_lcd.character_lcd_rgb_i2c as character_lcd
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+            lcd = character_lcd.Character_LCD_RGB_I2C(i2c, 16, 2)
+
+            lcd.message = "Hello, world!"
+            while True:
+                time.sleep(60)
+                if lcd.repair():
+                    print("Display repaired")
+
+        :return: The number of characters and custom characters rewritten.
+        """
+        from adafruit_character_lcd._readback import repair  # noqa: PLC0415
+
+        return repair(self)
+
+    def load_from_display(self) -> None:
+        """Read the display data RAM and all 8 custom characters back from the display, and
+        use them as what was last written to it. Needs a ``read_write`` pin.
+
+        This is done when the display is attached to with ``init=False`` and there is a
+        ``read_write`` pin. Otherwise the driver assumes an attached display is blank and
+        has no custom characters, so `write_at` and `create_char` may skip writes they
+        need: call this once the pin is set, or write the whole display with `message`.
+        Until then, or until the display is cleared, `clear` and `home` are always sent.
+        The display settings, such as `cursor` and `text_direction`, and any `move_left`
+        or `move_right` shift cannot be read back. Attaching assumes no shift, and the
+        settings the driver initialises displays with until they are set: each setting
+        is sent the first time it is set, even to the value assumed, and the text
+        direction is sent before the first character is written.
+
+        .. code-block:: python
+
+            import board
+            import adafruit_character_lcd.character_lcd_rgb_i2c as character_lcd
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+            # reads back what the display shows, without flashing it blank
+            lcd = character_lcd.Character_LCD_RGB_I2C(i2c, 16, 2, init=False)
+            lcd.write_at(0, 1, "Restarted")
+        """
+        from adafruit_character_lcd._readback import load_from_display  # noqa: PLC0415
+
+        load_from_display(self)
+
+    def save_state(self) -> bytearray:
+        """Save everything the driver has written to the display: its contents, custom
+        characters, settings, display shift and backlight or color, in a little over 150
+        bytes. Store it in a file, or in memory that survives a reset such as
+        ``microcontroller.nvm``, and pass it to `restore_state` after a restart.
+
+        :return: The saved state.
+        """
+        from adafruit_character_lcd._state import save_state  # noqa: PLC0415
+
+        return save_state(self)
+
+    def restore_state(self, state: bytes, shown: bool = False) -> None:
+        """Restore a state saved with `save_state`, writing only the characters, custom
+        characters and settings that differ from what the display is known to show.
+
+        Pass ``shown=True`` when the display still shows the saved state, as when a
+        program restarts and attaches to the display with ``init=False``. Nothing is then
+        written to the display itself, only the backlight or color is set, and later
+        writes send just what differs from the saved state.
+
+        The following example carries the display over a restart without redrawing it.
+
+        .. code-block:: python
+
+            import board
+            import adafruit_character_lcd.character_lcd_i2c as character_lcd
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+            try:
+                with open("/lcd_state.bin", "rb") as file:
+                    state = file.read()
+            except OSError:
+                state = None
+            lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2, init=state is None)
+            if state:
+                lcd.restore_state(state, shown=True)
+
+            lcd.write_at(0, 0, "Uptime: 0")
+            with open("/lcd_state.bin", "wb") as file:
+                file.write(lcd.save_state())
+
+        :param bytes state: The state returned by `save_state`.
+        :param bool shown: Whether the display already shows ``state``.
+        """
+        from adafruit_character_lcd._state import restore_state  # noqa: PLC0415
+
+        restore_state(self, state, shown)
+
+    @property
+    def max_fps(self) -> Optional[float]:
+        """The most times a second the display is written to by `message`, `write_at` and
+        `clear`, or ``None`` to write every change straight away, the default.
+
+        Sensors can change far faster than a character LCD, whose pixels take around
+        100 ms to change, can show. With a frame rate set, those methods only update a
+        frame of what the display should show. The first change after a quiet spell is
+        written straight away, and changes made within a frame of it are held back. Call
+        `update` regularly, for example once per pass through your main loop, to write
+        them when the next frame is due: only the characters that differ from what the
+        display shows are sent, however many times they changed in between. Settings,
+        custom characters and scrolling are still written straight away. Rates must be
+        above ``0``.
+
+        The following example shows a fast changing reading at no more than 10 frames
+        a second.
+
+        .. code-block:: python
+
+            import board
+            import analogio
+            import adafruit_character_lcd.character_lcd_i2c as character_lcd
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+            lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2)
+            sensor = analogio.AnalogIn(board.A0)
+
+            lcd.max_fps = 10
+            lcd.message = "Reading:"
+            while True:
+                lcd.write_at(9, 0, f"{sensor.value:5d}")
+                lcd.update()
+        """
+        if self._frame is None or not self._frame.interval:
+            return None
+        return 1 / self._frame.interval
+
+    @max_fps.setter
+    def max_fps(self, fps: Optional[float]) -> None:
+        if fps is None:
+            # While overlays are shown the frame holds what they cover, and is
+            # written as soon as it changes.
+            if self._frame is not None:
+                self._frame.interval = 0.0
+                if self._frame.cover is None:
+                    self.refresh()
+                    self._frame = None
+            return
+        if fps <= 0:
+            raise ValueError("max_fps must be above 0, or None")
+        from adafruit_character_lcd._frames import start_frame  # noqa: PLC0415
+
+        start_frame(self).interval = 1 / fps
+
+    def refresh(self) -> None:
+        """Write the frame to the display now, without waiting for it to be due. Only the
+        characters that differ from what the display shows are sent. Does nothing unless
+        `max_fps` is set.
+        """
+        from adafruit_character_lcd._frames import refresh  # noqa: PLC0415
+
+        refresh(self)
+
+    def update(self) -> bool:
+        """Write the frame when it is due, if `max_fps` is set and it has changed since the
+        last one. Returns True while a frame is waiting to be written.
+        """
+        if self._overlays is not None:
+            self._overlays.update()
+        frame = self._frame
+        if frame is None:
+            return False
+        if frame.dirty and time.monotonic() >= frame.due:
+            self.refresh()
+        return frame.dirty
+
+    def _schedule(self) -> None:
+        # The frame has changed: write it if a frame is due, or leave it for update.
+        self._frame.dirty = True
+        if time.monotonic() >= self._frame.due:
+            self.refresh()
+
+    def resync(self) -> None:
+        """Reinitialise the display and restore everything written to it through the
+        driver: display settings, custom characters, display shift, contents and the
+        position of the address counter. Use this after the display has been power cycled.
+
+        Writes that fail with ``OSError``, as when an I2C backpack drops off the bus part
+        way through a character, are recovered from automatically: the display is
+        resynchronised and the write is retried up to `retries` times.
+        """
+        from adafruit_character_lcd._state import resync  # noqa: PLC0415
+
+        resync(self)
+
+    def _save_extra(self) -> bytes:  # noqa: PLR6301
+        # State of subclasses, such as the backlight, to save after the display's.
+        return b""
+
+    def _restore_extra(self, extra: bytes) -> None:
+        # Restore state saved by _save_extra.
+        pass
+
+    def _reinit_pins(self) -> None:
+        # Set the pins driving the display up again before a resync. Pins on the
+        # board keep their settings, but subclasses using I/O expanders restore
+        # expanders that may have been reset.
+        pass
+
+    def _wake(self) -> None:
+        # Send 0x3 three times, then 0x2, to get into 4 bit mode, and in step with
+        # the nibbles, whatever state the display was left in.
+        self._write8(0x33)
+        self._write8(0x32)
+
+    def _write(self, value: int, char_mode: bool = False) -> None:
+        # Sends 8b ``value`` in ``char_mode`` with _write8, recovering from bus
+        # errors by resynchronising the display and sending ``value`` again.
+        delay = self.retry_delay
+        resync = False
+        for attempt in range(self.retries + 1):
+            try:
+                if resync:
+                    self.resync()
+                self._write8(value, char_mode)
+                return
+            except OSError:
+                if attempt == self.retries:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+                resync = True
+
+    def _write_ddram(
+        self,
+        address: int,
+        values: Union[str, ReadableBuffer],
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        # Show the characters or character codes ``values[start:end]`` from DDRAM
+        # ``address``, writing only those that differ from the display, or to the
+        # frame. Creates no objects when ``values`` holds character codes.
+        if end is None:
+            end = len(values)
+        code = ord if isinstance(values, str) else int
+        left = self.displaymode & _LCD_ENTRYLEFT
+        frame = None if self._frame is None else self._frame.ddram
+        # Visit cells in the order the address counter moves, so runs of changed
+        # characters are written without setting the address in between.
+        for step in range(start, end):
+            index = step if left else start + end - 1 - step
+            value = code(values[index]) & 0xFF
+            cell = address + index - start
+            if frame is not None:
+                frame[cell] = value
+            elif self._ddram[cell] != value:
+                self._set_address(cell)
+                self._write_char(value)
+        if frame is not None:
+            self._schedule()
+
+    def _shift_by(self, shift: int) -> None:
+        # Shift the display right by ``shift`` columns, or left when negative, by
+        # the shortest way round its 40 columns.
+        shift %= 40
+        while shift:
+            if shift <= 20:
+                self.move_right()
+                shift -= 1
+            else:
+                self.move_left()
+                shift = (shift + 1) % 40
+
+    def _set_address(self, address: int) -> None:
+        # Point the address counter at DDRAM ``address``, unless it is already
+        # there, as it is after writing the character before.
+        if self._address == address:
+            return
+        self._send_mode()
+        self._write(_LCD_SETDDRAMADDR | address)
+        self._address = address
+        self._cgram_address = None
+
+    def _set_control(self, control: int) -> None:
+        # Write the display control register, unless it already holds ``control``.
+        if control != self.displaycontrol or self._unsent & _UNSENT_CONTROL:
+            self.displaycontrol = control
+            self._unsent &= ~_UNSENT_CONTROL
+            self._write(_LCD_DISPLAYCONTROL | control)
+
+    def _set_mode(self, mode: int) -> None:
+        # Write the entry mode register, unless it already holds ``mode``.
+        if mode != self.displaymode or self._unsent & _UNSENT_MODE:
+            self.displaymode = mode
+            self._unsent &= ~_UNSENT_MODE
+            self._write(_LCD_ENTRYMODESET | mode)
+
+    def _send_mode(self) -> None:
+        # The shadows follow the address counter in the entry direction, so send the
+        # entry mode before characters are written if it has not been yet.
+        if self._unsent & _UNSENT_MODE:
+            self._set_mode(self.displaymode)
+
+    def _write_char(self, value: int) -> None:
+        # Write a character at the address counter, keeping the DDRAM shadow up to
+        # date and stepping the address as the LCD does in 2 line mode. Codes
+        # above 255 are masked to 8 bits, as the LCD only takes those.
+        value &= 0xFF
+        self._write(value, True)
+        address = self._address
+        if address is None:
+            return
+        self._ddram[address] = value
+        self._address = self._next_address(address)
+
+    def _next_address(self, address: int) -> int:
+        # The DDRAM address after ``address`` in the entry direction, as the LCD
+        # steps it in 2 line mode.
+        if self.displaymode & _LCD_ENTRYLEFT:
+            if address == 0x27:
+                return 0x40
+            if address == 0x67:
+                return 0x00
+            return address + 1
+        if address == 0x00:
+            return 0x67
+        if address == 0x40:
+            return 0x27
+        return address - 1
 
     def _write8(self, value: int, char_mode: bool = False) -> None:
         # Sends 8b ``value`` in ``char_mode``.
@@ -505,19 +1170,29 @@ class Character_LCD:
         #  set character/data bit. (charmode = False)
         self.reset.value = char_mode
         # WRITE upper 4 bits
-        self.dl4.value = ((value >> 4) & 1) > 0
-        self.dl5.value = ((value >> 5) & 1) > 0
-        self.dl6.value = ((value >> 6) & 1) > 0
-        self.dl7.value = ((value >> 7) & 1) > 0
+        levels = _NIBBLE_LEVELS[value >> 4 & 0x0F]
+        self.dl4.value = levels[0]
+        self.dl5.value = levels[1]
+        self.dl6.value = levels[2]
+        self.dl7.value = levels[3]
         #  send command
         self._pulse_enable()
         # WRITE lower 4 bits
-        self.dl4.value = (value & 1) > 0
-        self.dl5.value = ((value >> 1) & 1) > 0
-        self.dl6.value = ((value >> 2) & 1) > 0
-        self.dl7.value = ((value >> 3) & 1) > 0
+        levels = _NIBBLE_LEVELS[value & 0x0F]
+        self.dl4.value = levels[0]
+        self.dl5.value = levels[1]
+        self.dl6.value = levels[2]
+        self.dl7.value = levels[3]
         self._pulse_enable()
 
+    def _read_into(self, buffer: bytearray, char_mode: bool) -> None:
+        # Reads len(buffer) bytes in ``char_mode`` into ``buffer``.
+        # :param char_mode: character/data mode selector. False (default) for
+        # the busy flag and address counter, True for character bits.
+        from adafruit_character_lcd._readback import read_into  # noqa: PLC0415
+
+        read_into(self, buffer, char_mode)
+
     def _pulse_enable(self) -> None:
         # Pulses (lo->hi->lo) to send commands.
         self.enable.value = False
@@ -540,10 +1215,13 @@ class Character_LCD_Mono(Character_LCD):
     :param ~digitalio.DigitalInOut d7_dio: The data line 7
     :param int columns: The columns on the charLCD
     :param int lines: The lines on the charLCD
-    :param ~digitalio.DigitalInOut backlight_pin: The backlight pin
+    :param ~digitalio.DigitalInOut,~pwmio.PWMOut backlight_pin: The backlight pin. Use a
+        ``pwmio.PWMOut`` to control `brightness`.
     :param bool backlight_inverted: ``False`` if LCD is not inverted, i.e. backlight pin is
         connected to common anode. ``True`` if LCD is inverted i.e. backlight pin is connected
         to common cathode.
+    :param bool init: ``True`` to initialise and clear the display. ``False`` to attach to a
+        display that is already initialised. See `Character_LCD.load_from_display`.
 
     """
 
@@ -557,18 +1235,29 @@ class Character_LCD_Mono(Character_LCD):
         d7_dio: digitalio.DigitalInOut,
         columns: int,
         lines: int,
-        backlight_pin: Optional[digitalio.DigitalInOut] = None,
+        backlight_pin: Optional[Union[digitalio.DigitalInOut, pwmio.PWMOut]] = None,
         backlight_inverted: bool = False,
+        init: bool = True,
     ):
         # Backlight pin and inversion
         self.backlight_pin = backlight_pin
         self.backlight_inverted = backlight_inverted
+        self._backlight_pwm = hasattr(backlight_pin, "duty_cycle")
+        self._backlight_on = False
+        self._brightness = 1.0
+        # last duty cycle or pin value written to the backlight
+        self._backlight_output = None
+        # idle dimming set up by dim_when_idle
+        self._dimming = None
 
         #  Setup backlight
         if backlight_pin is not None:
-            self.backlight_pin.direction = digitalio.Direction.OUTPUT
+            if not self._backlight_pwm:
+                self.backlight_pin.direction = digitalio.Direction.OUTPUT
             self.backlight = True
-        super().__init__(reset_dio, enable_dio, d4_dio, d5_dio, d6_dio, d7_dio, columns, lines)
+        super().__init__(
+            reset_dio, enable_dio, d4_dio, d5_dio, d6_dio, d7_dio, columns, lines, init
+        )
 
     @property
     def backlight(self) -> Optional[bool]:
@@ -600,7 +1289,134 @@ class Character_LCD_Mono(Character_LCD):
     @backlight.setter
     def backlight(self, enable):
         self._backlight_on = enable
-        self.backlight_pin.value = enable ^ self.backlight_inverted
+        self.wake()
+
+    @property
+    def brightness(self) -> float:
+        """The backlight brightness while it is on, from ``0.0`` to ``1.0``. Takes effect
+        when the backlight pin is a ``pwmio.PWMOut``; otherwise the backlight is lit for any
+        brightness above ``0.0``. Defaults to ``1.0``.
+
+        The following example sets up a dimmable backlight on a PWM pin at half brightness.
+
+        .. code-block:: python
+
+            import board
+            import digitalio
+            import pwmio
+            import adafruit_character_lcd.character_lcd as characterlcd
+
+            lcd_rs = digitalio.DigitalInOut(board.D7)
+            lcd_en = digitalio.DigitalInOut(board.D8)
+            lcd_d7 = digitalio.DigitalInOut(board.D12)
+            lcd_d6 = digitalio.DigitalInOut(board.D11)
+            lcd_d5 = digitalio.DigitalInOut(board.D10)
+            lcd_d4 = digitalio.DigitalInOut(board.D9)
+            lcd_backlight = pwmio.PWMOut(board.D13)
+
+            lcd = characterlcd.Character_LCD_Mono(
+                lcd_rs, lcd_en, lcd_d4, lcd_d5, lcd_d6, lcd_d7, 16, 2, lcd_backlight
+            )
+            lcd.brightness = 0.5
+        """
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, brightness: float) -> None:
+        self._brightness = max(0.0, min(1.0, brightness))
+        self.wake()
+
+    def dim_when_idle(
+        self, timeout: Optional[float], brightness: float = 0.0, duration: float = 1.0
+    ) -> None:
+        """Dim the backlight once ``timeout`` seconds pass without a call to `wake`,
+        ramping it down to ``brightness`` over ``duration`` seconds. The ramp does not
+        block: call `update` regularly, for example once per pass through your main loop,
+        to run it. Set ``timeout`` to ``None`` to stop dimming.
+
+        The following example dims the backlight after 30 seconds without a button press.
+
+        .. code-block:: python
+
+            import board
+            import keypad
+            import adafruit_character_lcd.character_lcd_i2c as character_lcd
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+            keys = keypad.Keys((board.D5,), value_when_pressed=False)
+
+            lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2)
+
+            lcd.dim_when_idle(30, brightness=0.1)
+            while True:
+                if keys.events.get():
+                    lcd.wake()
+                lcd.update()
+
+        :param float timeout: Idle seconds before dimming, or ``None`` to never dim.
+        :param float brightness: Brightness to dim to, from ``0.0`` to ``1.0``. Values
+            outside that range are clamped to it, as for `brightness`.
+        :param float duration: Seconds the ramp down takes.
+        """
+        if timeout is None:
+            self._dimming = None
+        else:
+            from adafruit_character_lcd._fades import Dimming  # noqa: PLC0415
+
+            self._dimming = Dimming(timeout, max(0.0, min(1.0, brightness)), duration)
+        self.wake()
+
+    def wake(self) -> None:
+        """Restart the idle timer set by `dim_when_idle`, and restore the backlight to
+        `brightness` if it had been dimmed.
+        """
+        if self._dimming is not None:
+            self._dimming.wake()
+        if self.backlight_pin is not None:
+            self._write_backlight(self._brightness if self._backlight_on else 0.0)
+
+    def update(self) -> bool:
+        """Dim the backlight if it has been idle for the `dim_when_idle` timeout, and
+        advance the dimming ramp to match the time elapsed since it started. The backlight
+        is only written when its output changes. Also writes the frame when it is due, if
+        `max_fps` is set. Returns True while the ramp is running or a frame is waiting.
+        """
+        waiting = super().update()
+        if self._dimming is None:
+            return waiting
+        return self._dimming.update(self) or waiting
+
+    def _save_extra(self) -> bytes:
+        # The backlight and its brightness.
+        return bytes((self._backlight_on, int(self._brightness * 255 + 0.5)))
+
+    def _restore_extra(self, extra: bytes) -> None:
+        if len(extra) >= 2:
+            self._brightness = extra[1] / 255
+            self.backlight = bool(extra[0])
+
+    def _write_backlight(self, brightness: float) -> None:
+        # Show ``brightness`` on the backlight pin.
+        if self._backlight_pwm:
+            duty_cycle = _duty_cycle(brightness * 100)
+            self._set_backlight_output(
+                duty_cycle if self.backlight_inverted else 65535 - duty_cycle
+            )
+        else:
+            self._set_backlight_output((brightness > 0) ^ self.backlight_inverted)
+
+    def _set_backlight_output(self, output: Union[int, bool]) -> None:
+        # Write a duty cycle or pin value to the backlight, unless it is already set.
+        if output != self._backlight_output:
+            self._backlight_output = output
+            if self._backlight_pwm:
+                self.backlight_pin.duty_cycle = output
+            else:
+                self._write_backlight_pin(output)
+
+    def _write_backlight_pin(self, value: bool) -> None:
+        # Set the level of a digital backlight pin.
+        self.backlight_pin.value = value
 
 
 class Character_LCD_RGB(Character_LCD):
@@ -619,6 +1435,8 @@ class Character_LCD_RGB(Character_LCD):
     :param ~pwmio.PWMOut,~digitalio.DigitalInOut blue: Blue RGB Anode
     :param ~digitalio.DigitalInOut read_write: The rw pin. Determines whether to read to or
         write from the display. Not necessary if only writing to the display. Used on shield.
+    :param bool init: ``True`` to initialise and clear the display. ``False`` to attach to a
+        display that is already initialised. See `Character_LCD.load_from_display`.
 
     """
 
@@ -636,6 +1454,7 @@ class Character_LCD_RGB(Character_LCD):
         green: Union[pwmio.PWMOut, digitalio.DigitalInOut],
         blue: Union[pwmio.PWMOut, digitalio.DigitalInOut],
         read_write: Optional[digitalio.DigitalInOut] = None,
+        init: bool = True,
     ) -> None:
         # Define read_write (rw) pin
         self.read_write = read_write
@@ -656,9 +1475,17 @@ class Character_LCD_RGB(Character_LCD):
                     "RGB LED objects must be instances of digitalio.DigitalInOut"
                     " or pwmio.PWMOut, or provide a compatible interface."
                 )
+        # whether each channel takes a duty cycle, or can only be on or off
+        self._pwm = tuple(hasattr(pin, "duty_cycle") for pin in self.rgb_led)
 
         self._color = [0, 0, 0]
-        super().__init__(reset_dio, enable_dio, d4_dio, d5_dio, d6_dio, d7_dio, columns, lines)
+        # last duty cycle or pin value written to each channel
+        self._outputs = [None, None, None]
+        # running fade started by fade_sequence
+        self._fade = None
+        super().__init__(
+            reset_dio, enable_dio, d4_dio, d5_dio, d6_dio, d7_dio, columns, lines, init
+        )
 
     @property
     def color(self) -> List[int]:
@@ -696,18 +1523,121 @@ class Character_LCD_RGB(Character_LCD):
         if isinstance(color, int):
             if color >> 24:
                 raise ValueError("Integer color value must be positive and 24 bits max")
+            channels = (color >> 16, color >> 8 & 0xFF, color & 0xFF)
+            # 8 bit channels scale exactly onto 16 bit duty cycles. Without PWM a
+            # channel is on above a 0 - 100 level of 1, as for list colors.
+            outputs = [
+                65535 - channel * 257 if pwm else channel * 100 <= 255
+                for channel, pwm in zip(channels, self._pwm)
+            ]
             # NOTE: convert to 0-100
-            r = (color >> 16) / 2.55
-            g = ((color >> 8) & 0xFF) / 2.55
-            b = (color & 0xFF) / 2.55
-            color = [r, g, b]
+            color = [channel * 100 // 255 for channel in channels]
+        else:
+            # If we don't have a PWM interface, all we can do is turn each color
+            # on / off: write 0 (on) to pin for any value greater than 1, or 1 (off).
+            outputs = [
+                _duty_cycle(level) if pwm else not level > 1 for level, pwm in zip(color, self._pwm)
+            ]
         self._color = color
+        self._fade = None
+        self._write_outputs(outputs)
+
+    def _save_extra(self) -> bytes:
+        # The color, as 0 - 100 levels.
+        return bytes(max(0, min(100, int(level + 0.5))) for level in self._color)
+
+    def _restore_extra(self, extra: bytes) -> None:
+        if len(extra) >= 3:
+            self.color = list(extra[:3])
+
+    def _write_outputs(self, outputs: List[Union[int, bool]]) -> None:
+        # Write the duty cycle or pin value of each channel that has changed since
+        # it was last written.
         for number, pin in enumerate(self.rgb_led):
-            if hasattr(pin, "duty_cycle"):
-                # Assume a pwmio.PWMOut or compatible interface and set duty cycle:
-                pin.duty_cycle = int(_map(color[number], 0, 100, 65535, 0))
-            elif hasattr(pin, "value"):
-                # If we don't have a PWM interface, all we can do is turn each color
-                # on / off.  Assume a DigitalInOut (or compatible interface) and write
-                # 0 (on) to pin for any value greater than 0, or 1 (off) for 0:
-                pin.value = not color[number] > 1
+            output = outputs[number]
+            if output != self._outputs[number]:
+                if self._pwm[number]:
+                    pin.duty_cycle = output
+                else:
+                    pin.value = output
+                self._outputs[number] = output
+
+    def fade_to(self, color: Union[List[float], int], duration: float) -> None:
+        """Start fading the backlight from its current color to ``color`` over
+        ``duration`` seconds. The fade does not block: call `update` regularly,
+        for example once per pass through your main loop, to advance it.
+
+        Colors take the same forms as `color`. PWM channels are stepped along a
+        gamma corrected curve so the fade looks even; channels without PWM switch
+        when the fade completes.
+
+        The following example fades the backlight from off to red over two seconds.
+
+        .. code-block:: python
+
+            import board
+            import adafruit_character_lcd.character_lcd_rgb_i2c as character_lcd
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+
+            lcd = character_lcd.Character_LCD_RGB_I2C(i2c, 16, 2)
+
+            lcd.color = [0, 0, 0]
+            lcd.fade_to([100, 0, 0], 2)
+            while lcd.update():
+                pass
+
+        :param list,int color: The color to fade to.
+        :param float duration: Seconds the fade takes.
+        """
+        self.fade_sequence((color,), duration)
+
+    def fade_sequence(
+        self, colors: Sequence[Union[List[float], int]], duration: float, loop: bool = False
+    ) -> None:
+        """Start fading the backlight through each of ``colors`` in turn, taking
+        ``duration`` seconds per color. With ``loop`` set the sequence repeats
+        until another color or fade is set. Call `update` regularly to advance it.
+
+        The following example pulses the backlight red once a second.
+
+        .. code-block:: python
+
+            import board
+            import adafruit_character_lcd.character_lcd_rgb_i2c as character_lcd
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+
+            lcd = character_lcd.Character_LCD_RGB_I2C(i2c, 16, 2)
+
+            lcd.message = "Alarm!"
+            lcd.fade_sequence(([100, 0, 0], [10, 0, 0]), 0.5, loop=True)
+            while True:
+                lcd.update()
+
+        :param Sequence colors: The colors to fade through.
+        :param float duration: Seconds the fade to each color takes.
+        :param bool loop: True to repeat the sequence.
+        """
+        from adafruit_character_lcd._fades import Fade  # noqa: PLC0415
+
+        # carry on from wherever a running fade has got to
+        fade = Fade(colors, duration, loop, None if self._fade is None else self._fade.at)
+        self._fade = fade
+        fade.start(self, 0)
+
+    @property
+    def fading(self) -> bool:
+        """True while a fade started by `fade_to` or `fade_sequence` is running."""
+        return self._fade is not None
+
+    def update(self) -> bool:
+        """Advance a running backlight fade to match the time elapsed since it
+        started. Only channels whose duty cycle changes are written. Also writes
+        the frame when it is due, if `max_fps` is set. Returns True while the fade
+        is still running or a frame is waiting.
+        """
+        waiting = super().update()
+        if self._fade is None:
+            return waiting
+        return self._fade.update(self) or waiting
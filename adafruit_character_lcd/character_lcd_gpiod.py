@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd.character_lcd_gpiod`
+====================================================
+
+Module for using a parallel character LCD through the Linux GPIO character device
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Linux with the GPIO character device, for example on a Raspberry Pi
+
+* libgpiod 2 and its Python bindings:
+  https://pypi.org/project/gpiod/
+
+"""
+
+try:
+    from typing import Any, Optional, Union
+except ImportError:
+    pass
+
+import time
+
+from adafruit_character_lcd.character_lcd import Character_LCD_Mono
+
+try:
+    from gpiod.line import Direction, Value
+
+    _LEVELS = (Value.INACTIVE, Value.ACTIVE)
+except ImportError:
+    # Line requests made some other way, such as mocks, take plain levels.
+    _LEVELS = (0, 1)
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+
+class _Line:
+    # One requested output line, standing in for a digitalio pin where the
+    # driver sets pins one at a time.
+
+    def __init__(self, request: Any, offset: int) -> None:
+        self._request = request
+        self._offset = offset
+        self._value = False
+        self.direction = None
+
+    @property
+    def value(self) -> bool:
+        return self._value
+
+    @value.setter
+    def value(self, value: bool) -> None:
+        self._value = bool(value)
+        self._request.set_value(self._offset, _LEVELS[self._value])
+
+
+class Character_LCD_GPIOD(Character_LCD_Mono):
+    """Parallel character LCD driven through the Linux GPIO character device, such as
+    ``/dev/gpiochip0`` on a Raspberry Pi. This is a subclass of `Character_LCD_Mono` and
+    implements all the same functions and functionality.
+
+    The LCD lines are requested together, so RS and the four data lines are set in one
+    ``set_values`` call for each nibble, and enable in one call each time it changes,
+    rather than one ``digitalio`` assignment per line.
+
+    Lines are given by their offsets on the chip, which are the BCM GPIO numbers on a
+    Raspberry Pi. To use, import and initialise as follows:
+
+    .. code-block:: python
+
+        from adafruit_character_lcd.character_lcd_gpiod import Character_LCD_GPIOD
+
+        lcd = Character_LCD_GPIOD("/dev/gpiochip0", 25, 24, 23, 17, 18, 22, 16, 2)
+
+    :param str,~gpiod.LineRequest chip: The path or name of the GPIO chip, or a line request
+        that already has all the lines as outputs.
+    :param int reset_dio: The offset of the reset line
+    :param int enable_dio: The offset of the enable line
+    :param int d4_dio: The offset of data line 4
+    :param int d5_dio: The offset of data line 5
+    :param int d6_dio: The offset of data line 6
+    :param int d7_dio: The offset of data line 7
+    :param int columns: The columns on the charLCD
+    :param int lines: The lines on the charLCD
+    :param int backlight_pin: The offset of the backlight line
+    :param bool backlight_inverted: ``False`` if LCD is not inverted, i.e. backlight pin is
+        connected to common anode. ``True`` if LCD is inverted i.e. backlight pin is connected
+        to common cathode.
+    :param bool init: ``True`` to initialise and clear the display. ``False`` to attach to a
+        display that is already initialised. See `Character_LCD.load_from_display`.
+    """
+
+    def __init__(
+        self,
+        chip: Union[str, Any],
+        reset_dio: int,
+        enable_dio: int,
+        d4_dio: int,
+        d5_dio: int,
+        d6_dio: int,
+        d7_dio: int,
+        columns: int,
+        lines: int,
+        backlight_pin: Optional[int] = None,
+        backlight_inverted: bool = False,
+        init: bool = True,
+    ) -> None:
+        offsets = [reset_dio, enable_dio, d4_dio, d5_dio, d6_dio, d7_dio]
+        if backlight_pin is not None:
+            offsets.append(backlight_pin)
+        if isinstance(chip, str):
+            import gpiod  # noqa: PLC0415
+
+            if "/" not in chip:
+                chip = "/dev/" + chip
+            chip = gpiod.request_lines(
+                chip,
+                consumer="charlcd",
+                config={tuple(offsets): gpiod.LineSettings(direction=Direction.OUTPUT)},
+            )
+        self.request = chip
+        # The values to set for the RS and data lines for each nibble in either
+        # mode, indexed by mode << 4 | nibble, and to raise or lower enable.
+        data = (d4_dio, d5_dio, d6_dio, d7_dio)
+        self._nibbles = tuple(
+            dict(
+                [(reset_dio, _LEVELS[index >> 4])]
+                + [(offset, _LEVELS[index >> bit & 1]) for bit, offset in enumerate(data)]
+            )
+            for index in range(32)
+        )
+        self._enable_high = {enable_dio: _LEVELS[1]}
+        self._enable_low = {enable_dio: _LEVELS[0]}
+        super().__init__(
+            _Line(chip, reset_dio),
+            _Line(chip, enable_dio),
+            _Line(chip, d4_dio),
+            _Line(chip, d5_dio),
+            _Line(chip, d6_dio),
+            _Line(chip, d7_dio),
+            columns,
+            lines,
+            backlight_pin=None if backlight_pin is None else _Line(chip, backlight_pin),
+            backlight_inverted=backlight_inverted,
+            init=init,
+        )
+
+    def _write8(self, value: int, char_mode: bool = False) -> None:
+        # Sends 8b ``value`` in ``char_mode``.
+        # :param value: int
+        # :param char_mode: character/data mode selector. False (default) for
+        # data only, True for character bits.
+        # Wait out the 37 us the LCD takes for most commands. Each call below is
+        # a system call, far longer than the enable pulse and setup times.
+        time.sleep(0.00004)
+        set_values = self.request.set_values
+        mode = 0x10 if char_mode else 0
+        set_values(self._nibbles[mode | value >> 4 & 0x0F])
+        set_values(self._enable_high)
+        set_values(self._enable_low)
+        set_values(self._nibbles[mode | value & 0x0F])
+        set_values(self._enable_high)
+        set_values(self._enable_low)
+
+    def _wake(self) -> None:
+        # Send 0x3 three times, then 0x2, a nibble at a time. Unlike the commands
+        # _write8 waits for, the display needs over 4.1 ms after the first nibble
+        # and over 100 us after each of the others.
+        set_values = self.request.set_values
+        for nibble, delay in ((0x3, 0.0045), (0x3, 0.00015), (0x3, 0.00015), (0x2, 0.00015)):
+            set_values(self._nibbles[nibble])
+            set_values(self._enable_high)
+            set_values(self._enable_low)
+            time.sleep(delay)
@@ -38,12 +38,18 @@ except ImportError:
     pass
 
 from adafruit_mcp230xx.mcp23008 import MCP23008
+from micropython import const
 
-from adafruit_character_lcd.character_lcd import Character_LCD_Mono
+from adafruit_character_lcd.character_lcd import Character_LCD_Mono, _encode8, _port_table
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
 
+_ENABLE_BIT = const(0x04)
+_BACKLIGHT_BIT = const(0x80)
+_MCP23008_ADDRESS = const(0x20)
+_MCP23008_GPIO = const(0x09)
+
 
 class Character_LCD_I2C(Character_LCD_Mono):
     """Character LCD connected to I2C/SPI backpack using its I2C connection.
@@ -68,16 +74,29 @@ class Character_LCD_I2C(Character_LCD_Mono):
         lines: int,
         address: Optional[int] = None,
         backlight_inverted: bool = False,
+        init: bool = True,
     ) -> None:
         """Initialize character LCD connected to backpack using I2C connection
         on the specified I2C bus with the specified number of columns and
-        lines on the display. Optionally specify if backlight is inverted.
+        lines on the display. Optionally specify if backlight is inverted, and
+        ``init=False`` to attach to a display that is already initialised without
+        clearing it.
         """
 
+        # Attaching keeps the expander's outputs, rather than resetting them all
+        # to inputs and leaving the backlight and LCD lines floating.
         if address:
-            self.mcp = MCP23008(i2c, address=address)
+            self.mcp = MCP23008(i2c, address=address, reset=init)
         else:
-            self.mcp = MCP23008(i2c)
+            self.mcp = MCP23008(i2c, reset=init)
+        # Buses such as I2CDev that can write a register several times in one
+        # transfer send the words for each byte together.
+        self._i2c_address = address or _MCP23008_ADDRESS
+        self._write_register = getattr(i2c, "write_register", None)
+        # GPIO words for every byte, and the words for the byte being sent
+        self._table = _port_table(1, 3, 4, 5, 6)
+        self._buffer = bytearray(6)
+        self._backlight_bit = 0
         super().__init__(
             self.mcp.get_pin(1),  # reset
             self.mcp.get_pin(2),  # enable
@@ -89,8 +108,19 @@ class Character_LCD_I2C(Character_LCD_Mono):
             lines,
             backlight_pin=self.mcp.get_pin(7),
             backlight_inverted=backlight_inverted,
+            init=init,
         )
 
+    def _reinit_pins(self) -> None:
+        # The MCP23008 may have been reset: make pins 1 - 7 outputs again.
+        self.mcp.iodir = 0x01
+
+    def _write_backlight_pin(self, value: bool) -> None:
+        # Write the backlight bit along with the LCD lines as they were last left,
+        # rather than reading back the GPIO register to change one pin.
+        self._backlight_bit = int(value) << 7
+        self.mcp.gpio = (self._buffer[5] & ~_BACKLIGHT_BIT) | self._backlight_bit
+
     def _write8(self, value: int, char_mode: bool = False) -> None:
         # Sends 8b ``value`` in ``char_mode``.
         # :param value: bytes
@@ -109,17 +139,13 @@ class Character_LCD_I2C(Character_LCD_Mono):
         # reset:       bit 1
         # (unused):    bit 0
 
-        reset_bit = int(char_mode) << 1
-        backlight_bit = int(self.backlight ^ self.backlight_inverted) << 7
-
-        # Write char_mode and upper 4 bits of data, shifted to the correct position.
-        self.mcp.gpio = reset_bit | backlight_bit | ((value & 0xF0) >> 1)
-
-        #  do command
-        self._pulse_enable()
-
-        # Write char_mode and lower 4 bits of data, shifted to the correct position.
-        self.mcp.gpio = reset_bit | backlight_bit | ((value & 0x0F) << 3)
-
-        # do command
-        self._pulse_enable()
+        # Look up char_mode and both nibbles of data, shifted to the correct
+        # position, and clock each nibble in with the enable bit.
+        _encode8(self._buffer, self._table, value, char_mode, self._backlight_bit, _ENABLE_BIT)
+        if self._write_register is not None:
+            self._write_register(self._i2c_address, _MCP23008_GPIO, self._buffer)
+            return
+        # index rather than iterate, which would create an iterator for each byte
+        buffer = self._buffer
+        for index in range(6):
+            self.mcp.gpio = buffer[index]
@@ -0,0 +1,220 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd.character_lcd_pcf8574`
+====================================================
+
+Module for using character LCDs with PCF8574 I2C backpacks
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* Character LCDs with a PCF8574 or PCF8574A I2C backpack
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+* Adafruit's Bus Device library:
+  https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+
+"""
+
+import time
+
+try:
+    from typing import Any, Callable, Sequence
+
+    import busio
+except ImportError:
+    pass
+
+from adafruit_bus_device.i2c_device import I2CDevice
+from micropython import const
+
+from adafruit_character_lcd.character_lcd import Character_LCD_Mono, _encode8, _port_table
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+_PCF8574_ADDRESS = const(0x27)
+# Port words buffered before they are sent, even in the middle of a message.
+_CHUNK = const(192)
+
+
+class _Pin:
+    # Stands in for the expander pins: the LCD lines are all written by _write8.
+    direction = None
+    value = False
+
+
+def _streamed(method: Callable) -> Callable:
+    # Wrap ``method`` so that everything it writes to the display is sent as few
+    # multi-byte writes, once it returns.
+    def streamed(self: "Character_LCD_PCF8574", *args: Any, **kwargs: Any) -> Any:
+        self._depth += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._end_stream()
+
+    return streamed
+
+
+class Character_LCD_PCF8574(Character_LCD_Mono):
+    """Character LCD connected to a PCF8574 I2C backpack, the common backpack soldered to
+    many 16x2 and 20x4 displays. This is a subclass of `Character_LCD_Mono` and implements
+    all the same functions and functionality.
+
+    The PCF8574 has no registers: each byte written to it sets its 8 outputs. Every state
+    of the LCD lines needed to clock in a whole message is written in one I2C write,
+    rather than a transfer for each change of a line.
+
+    To use, import and initialise as follows:
+
+    .. code-block:: python
+
+        import board
+        from adafruit_character_lcd.character_lcd_pcf8574 import Character_LCD_PCF8574
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        lcd = Character_LCD_PCF8574(i2c, 16, 2)
+        lcd.message = "Hello\\nCircuitPython"
+
+    :param ~busio.I2C i2c: The I2C bus
+    :param int columns: The columns on the charLCD
+    :param int lines: The lines on the charLCD
+    :param int address: The I2C address of the backpack. ``0x27`` by default, and usually
+        ``0x3F`` for a PCF8574A.
+    :param Sequence[int] pins: The PCF8574 output, 0 - 7, wired to each of RS, RW, enable,
+        the backlight and data lines 4 - 7. ``(0, 1, 2, 3, 4, 5, 6, 7)`` by default, which
+        suits most backpacks.
+    :param bool backlight_inverted: ``False`` if the backlight is on when its output is
+        high, ``True`` if it is on when its output is low.
+    :param bool init: ``True`` to initialise and clear the display. ``False`` to attach to a
+        display that is already initialised. See `Character_LCD.load_from_display`.
+    """
+
+    def __init__(
+        self,
+        i2c: busio.I2C,
+        columns: int,
+        lines: int,
+        address: int = _PCF8574_ADDRESS,
+        pins: Sequence[int] = (0, 1, 2, 3, 4, 5, 6, 7),
+        backlight_inverted: bool = False,
+        init: bool = True,
+    ) -> None:
+        rs, _, enable, backlight, d4, d5, d6, d7 = pins
+        self._device = I2CDevice(i2c, address)
+        # Port words for every byte and the words for the byte being sent. RW is
+        # left low, as the display is only written to.
+        self._table = _port_table(rs, d4, d5, d6, d7)
+        self._buffer = bytearray(6)
+        self._enable_bit = 1 << enable
+        self._backlight_mask = 1 << backlight
+        self._backlight_bit = 0
+        # Port words waiting to be sent, and how many streamed calls are running.
+        self._stream = bytearray()
+        self._depth = 0
+        super().__init__(
+            _Pin(),
+            _Pin(),
+            _Pin(),
+            _Pin(),
+            _Pin(),
+            _Pin(),
+            columns,
+            lines,
+            backlight_pin=_Pin(),
+            backlight_inverted=backlight_inverted,
+            init=init,
+        )
+
+    home = _streamed(Character_LCD_Mono.home)
+    clear = _streamed(Character_LCD_Mono.clear)
+    _show_message = _streamed(Character_LCD_Mono._show_message)
+    write_at = _streamed(Character_LCD_Mono.write_at)
+    write_bytes = _streamed(Character_LCD_Mono.write_bytes)
+    create_char = _streamed(Character_LCD_Mono.create_char)
+    restore_state = _streamed(Character_LCD_Mono.restore_state)
+    refresh = _streamed(Character_LCD_Mono.refresh)
+    resync = _streamed(Character_LCD_Mono.resync)
+    # Written to directly by the canvas.
+    _write_ddram = _streamed(Character_LCD_Mono._write_ddram)
+    _shift_by = _streamed(Character_LCD_Mono._shift_by)
+
+    def _write_backlight_pin(self, value: bool) -> None:
+        # Write the backlight bit along with the LCD lines as they were last left.
+        self._backlight_bit = self._backlight_mask if value else 0
+        self._stream.append((self._buffer[5] & ~self._backlight_mask) | self._backlight_bit)
+        if not self._depth:
+            self._flush()
+
+    def _wake(self) -> None:
+        # Send the wake up bytes on their own, even in a stream, with the time the
+        # display needs to take each.
+        for value in (0x33, 0x32):
+            self._write8(value)
+            self._flush()
+            time.sleep(0.005)
+
+    def _write8(self, value: int, char_mode: bool = False) -> None:
+        # Sends 8b ``value`` in ``char_mode``.
+        # :param value: bytes
+        # :param char_mode: character/data mode selector. False (default) for
+        # data only, True for character bits.
+        # Look up char_mode and both nibbles of data, shifted to the correct
+        # position, and clock each nibble in with the enable bit.
+        _encode8(self._buffer, self._table, value, char_mode, self._backlight_bit, self._enable_bit)
+        self._stream += self._buffer
+        if not self._depth:
+            #  one ms delay to prevent writing too quickly.
+            time.sleep(0.001)
+            self._flush()
+        elif len(self._stream) >= _CHUNK or (not char_mode and value < 4):
+            # Clearing and going home take over a millisecond, so send them
+            # straight away for the caller to wait.
+            self._flush()
+
+    def _flush(self) -> None:
+        # Send the buffered port words. Within a stream, each byte takes the bus at
+        # least as long as the LCD takes to process it.
+        stream = self._stream
+        if stream:
+            try:
+                with self._device as device:
+                    device.write(stream)
+            finally:
+                del stream[:]
+
+    def _end_stream(self) -> None:
+        # Send the rest of a stream. Writes in a stream are only sent here, outside
+        # _write, so recover from bus errors as it does: the display shadows already
+        # hold everything that was streamed, so resynchronising writes it all.
+        try:
+            self._flush()
+        except OSError:
+            delay = self.retry_delay
+            for _ in range(self.retries):
+                time.sleep(delay)
+                delay *= 2
+                # Resynchronise in a stream sent here, so that a failure is
+                # retried by this loop rather than by resync itself.
+                self._depth += 1
+                try:
+                    Character_LCD_Mono.resync(self)
+                    self._flush()
+                    return
+                except OSError:
+                    pass
+                finally:
+                    self._depth -= 1
+            raise
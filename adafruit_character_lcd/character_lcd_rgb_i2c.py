@@ -38,20 +38,36 @@ Implementation Notes
 """
 
 try:
-    from typing import Optional
+    from typing import List, Optional
 
     import busio
 except ImportError:
     pass
 
+import time
+
 import digitalio
 from adafruit_mcp230xx.mcp23017 import MCP23017
+from micropython import const
 
-from adafruit_character_lcd.character_lcd import Character_LCD_RGB
+from adafruit_character_lcd.character_lcd import Character_LCD_RGB, _encode8, _port_table
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
 
+# Nibble for each level of GPIOB bits 1 - 4, which carry data lines 7 - 4.
+_NIBBLES = bytes((0, 8, 4, 12, 2, 10, 6, 14, 1, 9, 5, 13, 3, 11, 7, 15))
+
+_ENABLE_BIT = const(0x20)
+_READ_BIT = const(0x40)
+_DATA_BITS = const(0x1E)
+_BLUE_BIT = const(0x01)
+_RED_GREEN_BITS = const(0xC0)
+_MCP23017_ADDRESS = const(0x20)
+_MCP23017_GPIOB = const(0x13)
+# The buttons are on GPIOA bits 0 - 4, low when pressed.
+_BUTTON_BITS = const(0x1F)
+
 
 class Character_LCD_RGB_I2C(Character_LCD_RGB):
     """RGB Character LCD connected to I2C shield or Pi plate using I2C connection.
@@ -70,16 +86,27 @@ class Character_LCD_RGB_I2C(Character_LCD_RGB):
 
     """
 
-    def __init__(self, i2c: busio.I2C, columns: int, lines: int, address: Optional[int] = None):
+    def __init__(
+        self,
+        i2c: busio.I2C,
+        columns: int,
+        lines: int,
+        address: Optional[int] = None,
+        init: bool = True,
+    ):
         """Initialize RGB character LCD connected to shield using I2C connection
         on the specified I2C bus with the specified number of columns and lines
-        on the display.
+        on the display. Optionally specify ``init=False`` to attach to a display
+        that is already initialised, reading back what it shows rather than
+        clearing it.
         """
 
+        # Attaching keeps the expander's outputs, rather than resetting them all
+        # to inputs and leaving the LEDs and LCD lines floating.
         if address:
-            mcp = MCP23017(i2c, address=address)
+            mcp = MCP23017(i2c, address=address, reset=init)
         else:
-            mcp = MCP23017(i2c)
+            mcp = MCP23017(i2c, reset=init)
 
         self._left_button = mcp.get_pin(4)
         self._up_button = mcp.get_pin(3)
@@ -98,6 +125,22 @@ class Character_LCD_RGB_I2C(Character_LCD_RGB):
         for pin in self._buttons:
             pin.switch_to_input(pull=digitalio.Pull.UP)
 
+        # Buses such as I2CDev that can write a register several times in one
+        # transfer send the words for each byte together.
+        self._i2c_address = address or _MCP23017_ADDRESS
+        self._write_register = getattr(i2c, "write_register", None)
+        # Every LCD line is on port B, which it shares with the blue LED. Keep
+        # GPIOB words for every byte, the words for the byte being sent and the
+        # current blue LED level so it can be carried along with the data. Keep
+        # port A too, as the red and green LEDs are written to it directly.
+        self._mcp = mcp
+        self._table = _port_table(7, 4, 3, 2, 1)
+        self._buffer = bytearray(6)
+        mcp.get_pin(8).direction = digitalio.Direction.OUTPUT
+        self._blue_bit = mcp.gpiob & _BLUE_BIT
+        self._gpioa = mcp.gpioa
+        self._keypad = None
+
         super().__init__(
             mcp.get_pin(15),
             mcp.get_pin(13),
@@ -111,8 +154,86 @@ class Character_LCD_RGB_I2C(Character_LCD_RGB):
             mcp.get_pin(7),
             mcp.get_pin(8),
             mcp.get_pin(14),
+            init=init,
         )
 
+    def _reinit_pins(self) -> None:
+        # The MCP23017 may have been reset: make the buttons pulled up inputs and
+        # the LED and LCD lines outputs again, and restore the red and green LEDs.
+        self._mcp.iodira = 0x3F
+        self._mcp.gppua = 0x1F
+        self._mcp.iodirb = 0x00
+        self._mcp.gpioa = self._gpioa
+
+    def _write_outputs(self, outputs: List[bool]) -> None:
+        # Red and green are on port A and blue shares port B with the LCD, so
+        # write each port once, and only if one of its channels has changed.
+        last = self._outputs
+        if outputs[0] != last[0] or outputs[1] != last[1]:
+            self._gpioa = (self._gpioa & ~_RED_GREEN_BITS) | outputs[0] << 6 | outputs[1] << 7
+            self._mcp.gpioa = self._gpioa
+        if outputs[2] != last[2]:
+            # the last word written to port B leaves the LCD lines as they are
+            self._blue_bit = int(outputs[2])
+            self._mcp.gpiob = (self._buffer[5] & ~_BLUE_BIT) | self._blue_bit
+        last[:] = outputs
+
+    def _write8(self, value: int, char_mode: bool = False) -> None:
+        # Sends 8b ``value`` in ``char_mode``.
+        # :param value: bytes
+        # :param char_mode: character/data mode selector. False (default) for
+        # data only, True for character bits.
+        #  one ms delay to prevent writing too quickly.
+        time.sleep(0.001)
+
+        # port B bits are, MSB (7) to LSB (0)
+        # reset:       bit 7
+        # read/write:  bit 6 (low to write)
+        # enable:      bit 5
+        # data line 4: bit 4
+        # data line 5: bit 3
+        # data line 6: bit 2
+        # data line 7: bit 1
+        # blue LED:    bit 0
+
+        # Look up char_mode and both nibbles of data, shifted to the correct
+        # position, and clock each nibble in with the enable bit.
+        _encode8(self._buffer, self._table, value, char_mode, self._blue_bit, _ENABLE_BIT)
+        if self._write_register is not None:
+            self._write_register(self._i2c_address, _MCP23017_GPIOB, self._buffer)
+            return
+        # index rather than iterate, which would create an iterator for each byte
+        buffer = self._buffer
+        for index in range(6):
+            self._mcp.gpiob = buffer[index]
+
+    def _read_into(self, buffer: bytearray, char_mode: bool) -> None:
+        # Reads len(buffer) bytes in ``char_mode`` into ``buffer``.
+        # :param char_mode: character/data mode selector. False (default) for
+        # the busy flag and address counter, True for character bits.
+        #  one ms delay to let the last write finish.
+        time.sleep(0.001)
+        mcp = self._mcp
+        word = (0x80 if char_mode else 0) | _READ_BIT | self._blue_bit
+        # Make the data lines inputs, then read each nibble while enable is high.
+        mcp.iodirb = _DATA_BITS
+        mcp.gpiob = word
+        for index in range(len(buffer)):
+            mcp.gpiob = word | _ENABLE_BIT
+            value = _NIBBLES[(mcp.gpiob & _DATA_BITS) >> 1] << 4
+            mcp.gpiob = word
+            mcp.gpiob = word | _ENABLE_BIT
+            value |= _NIBBLES[(mcp.gpiob & _DATA_BITS) >> 1]
+            mcp.gpiob = word
+            buffer[index] = value
+        # Back to writing, with the data lines as outputs.
+        self._buffer[5] = word & ~_READ_BIT
+        mcp.gpiob = self._buffer[5]
+        mcp.iodirb = 0x00
+        # reading moves the address counter
+        self._address = None
+        self._cgram_address = None
+
     @property
     def left_button(self) -> bool:
         """The left button on the RGB Character LCD I2C Shield or Pi plate.
@@ -217,3 +338,46 @@ class Character_LCD_RGB_I2C(Character_LCD_RGB):
 
         """
         return not self._select_button.value
+
+    @property
+    def buttons(self) -> int:
+        """All the buttons held down, read together in one read of the expander port: select,
+        right, down, up and left from bit 0, as the bits of
+        `adafruit_character_lcd.keypad.Keypad`.
+
+        The following example prints which buttons are held:
+
+        .. code-block:: python
+
+            import board
+            from adafruit_character_lcd.character_lcd_rgb_i2c import Character_LCD_RGB_I2C
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+            lcd = Character_LCD_RGB_I2C(i2c, 16, 2)
+
+            while True:
+                print(f"{lcd.buttons:05b}")
+        """
+        return ~self._mcp.gpioa & _BUTTON_BITS
+
+    @property
+    def keypad(self) -> "Keypad":
+        """Debounced events from the buttons, with long presses, auto-repeat and chords.
+        See `adafruit_character_lcd.keypad.Keypad`.
+        """
+        if self._keypad is None:
+            # only load the keypad for applications that use it
+            from adafruit_character_lcd.keypad import Keypad  # noqa: PLC0415
+
+            self._keypad = Keypad(self)
+        return self._keypad
+
+    def update(self) -> bool:
+        """As `Character_LCD_RGB.update
+        <adafruit_character_lcd.character_lcd.Character_LCD_RGB.update>`, and also scans
+        the buttons if the `keypad` is in use and a scan is due.
+        """
+        waiting = super().update()
+        if self._keypad is not None:
+            self._keypad.update()
+        return waiting
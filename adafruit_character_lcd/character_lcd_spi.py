@@ -36,13 +36,19 @@ try:
 except ImportError:
     pass
 
+import time
+
 import adafruit_74hc595
+from micropython import const
 
-from adafruit_character_lcd.character_lcd import Character_LCD_Mono
+from adafruit_character_lcd.character_lcd import Character_LCD_Mono, _encode8, _port_table
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
 
+_ENABLE_BIT = const(0x04)
+_BACKLIGHT_BIT = const(0x80)
+
 
 class Character_LCD_SPI(Character_LCD_Mono):
     """Character LCD connected to I2C/SPI backpack using its SPI connection.
@@ -69,11 +75,13 @@ class Character_LCD_SPI(Character_LCD_Mono):
         columns: int,
         lines: int,
         backlight_inverted: bool = False,
+        init: bool = True,
     ):
         """Initialize character LCD connected to backpack using SPI connection
         on the specified SPI bus and latch line with the specified number of
         columns and lines on the display. Optionally specify if backlight is
-        inverted.
+        inverted, and ``init=False`` to attach to a display that is already
+        initialised without clearing it.
         """
 
         self._shift_register = adafruit_74hc595.ShiftRegister74HC595(spi, latch)
@@ -84,6 +92,12 @@ class Character_LCD_SPI(Character_LCD_Mono):
         db6 = self._shift_register.get_pin(4)
         db7 = self._shift_register.get_pin(3)
         backlight_pin = self._shift_register.get_pin(7)
+        # Shift register words for every byte, the words for the byte being
+        # sent and the single byte latched into the register
+        self._table = _port_table(1, 6, 5, 4, 3)
+        self._buffer = bytearray(6)
+        self._backlight_bit = 0
+        self._latch_byte = bytearray(1)
         super().__init__(
             reset,
             enable,
@@ -95,4 +109,38 @@ class Character_LCD_SPI(Character_LCD_Mono):
             lines,
             backlight_pin=backlight_pin,
             backlight_inverted=backlight_inverted,
+            init=init,
         )
+
+    def _write_backlight_pin(self, value: bool) -> None:
+        # Latch the backlight bit along with the LCD lines as they were last left.
+        self._backlight_bit = int(value) << 7
+        self._latch_byte[0] = (self._buffer[5] & ~_BACKLIGHT_BIT) | self._backlight_bit
+        self._shift_register.gpio = self._latch_byte
+
+    def _write8(self, value: int, char_mode: bool = False) -> None:
+        # Sends 8b ``value`` in ``char_mode``.
+        # :param value: bytes
+        # :param char_mode: character/data mode selector. False (default) for
+        # data only, True for character bits.
+        #  one ms delay to prevent writing too quickly.
+        time.sleep(0.001)
+
+        # bits are, MSB (7) to LSB (0)
+        # backlight:   bit 7
+        # data line 4: bit 6
+        # data line 5: bit 5
+        # data line 6: bit 4
+        # data line 7: bit 3
+        # enable:      bit 2
+        # reset:       bit 1
+        # (unused):    bit 0
+
+        # Look up char_mode and both nibbles of data, shifted to the correct
+        # position, and latch each word with a single SPI write.
+        _encode8(self._buffer, self._table, value, char_mode, self._backlight_bit, _ENABLE_BIT)
+        # index rather than iterate, which would create an iterator for each byte
+        buffer = self._buffer
+        for index in range(6):
+            self._latch_byte[0] = buffer[index]
+            self._shift_register.gpio = self._latch_byte
@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd.fields`
+====================================================
+
+Named, fixed-width fields for laying out values on character LCDs
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from typing import Any
+
+    from adafruit_character_lcd.character_lcd import Character_LCD
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+
+class Fields:
+    """Named, fixed-width regions of a character LCD. Each field is added once with its
+    position, width and alignment, then updated by assigning a value to its name. Values
+    are formatted and padded to the width of the field and only the characters that
+    change are sent to the display, so fields can be updated often without redrawing
+    or flickering anything around them.
+
+    Every `Character_LCD` has a `Fields` as its ``fields`` property.
+
+    The following example lays out a temperature and humidity dashboard.
+
+    .. code-block:: python
+
+        import board
+        import adafruit_character_lcd.character_lcd_i2c as character_lcd
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2)
+
+        lcd.message = "Temp:      C\\nHumidity:   %"
+        lcd.fields.add("temp", 6, 0, 5, align=">", fmt="{:.1f}")
+        lcd.fields.add("humidity", 10, 1, 3, align=">", fmt="{:.0f}")
+
+        lcd.fields["temp"] = 21.4
+        lcd.fields["humidity"] = 48
+
+    :param ~adafruit_character_lcd.character_lcd.Character_LCD lcd: The display to show
+        the fields on.
+    """
+
+    def __init__(self, lcd: Character_LCD) -> None:
+        self._lcd = lcd
+        # name -> (column, row, width, padding format, value format)
+        self._layouts = {}
+        self._values = {}
+
+    def add(
+        self,
+        name: str,
+        column: int,
+        row: int,
+        width: int,
+        align: str = "<",
+        fill: str = " ",
+        fmt: str = "{}",
+    ) -> None:
+        """Add a field, or change the layout of an existing one. Nothing is shown until
+        the field is assigned a value.
+
+        :param str name: The name of the field.
+        :param int column: The column the field starts at.
+        :param int row: The row the field is on.
+        :param int width: The number of characters in the field. Longer values are cut off.
+        :param str align: ``"<"`` to align values to the left of the field, ``">"`` to the
+            right or ``"^"`` to the center.
+        :param str fill: The character that pads values to the width of the field.
+        :param str fmt: The format string values are formatted with, such as ``"{:.1f}"``.
+        """
+        self._layouts[name] = (column, row, width, "{:" + fill + align + str(width) + "}", fmt)
+        self._values[name] = None
+
+    def remove(self, name: str) -> None:
+        """Remove a field. Whatever it shows is left on the display.
+
+        :param str name: The name of the field.
+        """
+        del self._layouts[name]
+        del self._values[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._layouts
+
+    def __getitem__(self, name: str) -> Any:
+        return self._values[name]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        column, row, width, padding, fmt = self._layouts[name]
+        self._values[name] = value
+        self._lcd.write_at(column, row, padding.format(fmt.format(value))[:width])
@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd.i2c_dev`
+====================================================
+
+Linux I2C bus using the i2c-dev interface directly, for the I2C backpack and the RGB
+shield and Pi plate
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `I2C / SPI character LCD backpack
+  <https://www.adafruit.com/product/292>`_ (Product ID: 292)
+
+* `Adafruit RGB Negative 16x2 LCD+Keypad Kit for Raspberry Pi
+  <https://www.adafruit.com/product/1110>`_ (Product ID: 1110)
+
+* `Adafruit RGB Positive 16x2 LCD+Keypad Kit for Raspberry Pi
+  <https://www.adafruit.com/product/1109>`_ (Product ID: 1109)
+
+**Software and Dependencies:**
+
+* Linux with the ``i2c-dev`` kernel module, for example on a Raspberry Pi
+
+"""
+
+try:
+    from typing import Callable, Optional, Sequence, Union
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+import ctypes
+import fcntl
+import os
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+# ioctl for combined transfers, the flag for messages that read, and the most
+# messages the kernel accepts in one transfer.
+_I2C_RDWR = 0x0707
+_I2C_M_RD = 0x0001
+_I2C_RDWR_MAX_MSGS = 42
+
+
+class _Message(ctypes.Structure):
+    # struct i2c_msg
+    _fields_ = [
+        ("addr", ctypes.c_uint16),
+        ("flags", ctypes.c_uint16),
+        ("len", ctypes.c_uint16),
+        ("buf", ctypes.POINTER(ctypes.c_uint8)),
+    ]
+
+
+class _Transfer(ctypes.Structure):
+    # struct i2c_rdwr_ioctl_data
+    _fields_ = [("msgs", ctypes.POINTER(_Message)), ("nmsgs", ctypes.c_uint32)]
+
+
+class I2CDev:
+    """An I2C bus on Linux, used through its ``/dev/i2c-N`` device rather than through
+    Blinka and ``busio``. It can be passed to `Character_LCD_I2C
+    <adafruit_character_lcd.character_lcd_i2c.Character_LCD_I2C>` and `Character_LCD_RGB_I2C
+    <adafruit_character_lcd.character_lcd_rgb_i2c.Character_LCD_RGB_I2C>` in place of
+    ``board.I2C()``. The six expander writes that clock each byte into the LCD are then
+    sent as one combined ``I2C_RDWR`` transfer, in a single system call.
+
+    It provides the ``busio.I2C`` methods the MCP230xx driver uses, so buttons and other
+    pins on the expander work as usual.
+
+    .. code-block:: python
+
+        from adafruit_character_lcd.character_lcd_rgb_i2c import Character_LCD_RGB_I2C
+        from adafruit_character_lcd.i2c_dev import I2CDev
+
+        i2c = I2CDev(1)  # /dev/i2c-1, the I2C pins on a Raspberry Pi
+        lcd = Character_LCD_RGB_I2C(i2c, 16, 2)
+
+    :param int,str bus: The bus number, or the path of its i2c-dev device.
+    :param int fd: An already open file descriptor for the bus, used instead of opening
+        ``bus``.
+    :param ioctl: The function making the ``ioctl`` system call, `fcntl.ioctl` by default.
+    """
+
+    def __init__(
+        self,
+        bus: Union[int, str] = 1,
+        fd: Optional[int] = None,
+        ioctl: Optional[Callable] = None,
+    ) -> None:
+        if fd is None:
+            path = bus if isinstance(bus, str) else f"/dev/i2c-{bus}"
+            fd = os.open(path, os.O_RDWR)
+        self._fd = fd
+        self._ioctl = ioctl or fcntl.ioctl
+        # Messages and two byte register writes, reused for every transfer.
+        self._messages = (_Message * _I2C_RDWR_MAX_MSGS)()
+        self._words = (ctypes.c_uint8 * (2 * _I2C_RDWR_MAX_MSGS))()
+        self._transfer = _Transfer(self._messages, 0)
+        for index in range(_I2C_RDWR_MAX_MSGS):
+            message = self._messages[index]
+            message.len = 2
+            message.buf = ctypes.cast(
+                ctypes.byref(self._words, 2 * index), ctypes.POINTER(ctypes.c_uint8)
+            )
+
+    def write_register(self, address: int, register: int, values: Sequence[int]) -> None:
+        """Write each of ``values`` to the 8 bit ``register`` of the device at ``address`` in
+        turn, in one combined transfer.
+
+        :param int address: The 7 bit address of the device.
+        :param int register: The register to write.
+        :param values: The bytes to write to it, one after another.
+        """
+        messages = self._messages
+        words = self._words
+        count = 0
+        for value in values:
+            if count == _I2C_RDWR_MAX_MSGS:
+                self._send(count)
+                count = 0
+            message = messages[count]
+            message.addr = address
+            message.flags = 0
+            words[2 * count] = register
+            words[2 * count + 1] = value
+            count += 1
+        if count:
+            self._send(count)
+
+    def writeto(
+        self, address: int, buffer: ReadableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Write ``buffer[start:end]`` to the device at ``address``, as ``busio.I2C`` does."""
+        self._transfer_messages(((address, 0, bytes(buffer[start:end])),))
+
+    def readfrom_into(
+        self,
+        address: int,
+        buffer: WriteableBuffer,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        """Read into ``buffer[start:end]`` from the device at ``address``, as ``busio.I2C``
+        does."""
+        end = len(buffer) if end is None else end
+        data = bytearray(end - start)
+        self._transfer_messages(((address, _I2C_M_RD, data),))
+        buffer[start:end] = data
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        out_buffer: ReadableBuffer,
+        in_buffer: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Write ``out_buffer[out_start:out_end]`` then read into
+        ``in_buffer[in_start:in_end]`` with a repeated start, as ``busio.I2C`` does."""
+        in_end = len(in_buffer) if in_end is None else in_end
+        data = bytearray(in_end - in_start)
+        self._transfer_messages(
+            (
+                (address, 0, bytes(out_buffer[out_start:out_end])),
+                (address, _I2C_M_RD, data),
+            )
+        )
+        in_buffer[in_start:in_end] = data
+
+    def try_lock(self) -> bool:
+        """Lock the bus. The kernel serialises transfers, so this succeeds whenever the bus
+        is open."""
+        return self._fd is not None
+
+    def unlock(self) -> None:
+        """Unlock the bus."""
+
+    def deinit(self) -> None:
+        """Close the bus."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "I2CDev":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.deinit()
+
+    def _send(self, count: int) -> None:
+        # Send the first ``count`` prepared register writes as one transfer.
+        self._transfer.nmsgs = count
+        self._ioctl(self._fd, _I2C_RDWR, self._transfer)
+
+    def _transfer_messages(self, messages: Sequence) -> None:
+        # Send (address, flags, data) messages as one transfer, copying back the
+        # data of those that read.
+        buffers = [(ctypes.c_uint8 * len(data)).from_buffer_copy(data) for _, _, data in messages]
+        structs = (_Message * len(messages))()
+        for index, (address, flags, data) in enumerate(messages):
+            structs[index].addr = address
+            structs[index].flags = flags
+            structs[index].len = len(data)
+            structs[index].buf = ctypes.cast(buffers[index], ctypes.POINTER(ctypes.c_uint8))
+        self._ioctl(self._fd, _I2C_RDWR, _Transfer(structs, len(messages)))
+        for index, (_, flags, data) in enumerate(messages):
+            if flags & _I2C_M_RD:
+                data[:] = bytes(buffers[index])[: len(data)]
@@ -0,0 +1,254 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd.keypad`
+====================================================
+
+Debounced keypad events, long presses, auto-repeat and chords for the RGB LCD shield and
+Pi plate
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `RGB LCD Shield Kit w/ 16x2 Character Display - Negative Display
+  <https://www.adafruit.com/product/714>`_ (Product ID: 714)
+
+* `RGB LCD Shield Kit w/ 16x2 Character Display - Positive Display
+  <https://www.adafruit.com/product/716>`_ (Product ID: 716)
+
+* `Adafruit RGB Negative 16x2 LCD+Keypad Kit for Raspberry Pi
+  <https://www.adafruit.com/product/1110>`_ (Product ID: 1110)
+
+* `Adafruit RGB Positive 16x2 LCD+Keypad Kit for Raspberry Pi
+  <https://www.adafruit.com/product/1109>`_ (Product ID: 1109)
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from typing import Optional, Sequence
+
+    from adafruit_character_lcd.character_lcd_rgb_i2c import Character_LCD_RGB_I2C
+except ImportError:
+    pass
+
+import time
+from collections import deque
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+
+class Event:
+    """Something the buttons of a keypad did.
+
+    :param int kind: What happened: `Keypad.PRESS`, `Keypad.RELEASE`,
+        `Keypad.LONG_PRESS`, `Keypad.REPEAT` or `Keypad.CHORD`.
+    :param int buttons: The button, or the buttons of a chord, as `Keypad.SELECT`,
+        `Keypad.RIGHT`, `Keypad.DOWN`, `Keypad.UP` and `Keypad.LEFT` bits.
+    :param float timestamp: The ``time.monotonic()`` time of the scan that saw it.
+    """
+
+    def __init__(self, kind: int, buttons: int, timestamp: float) -> None:
+        self.kind = kind
+        self.buttons = buttons
+        self.timestamp = timestamp
+
+    def __repr__(self) -> str:
+        return f"Event({self.kind}, {self.buttons:#04x}, {self.timestamp})"
+
+
+class Keypad:
+    """Turns the buttons of an RGB LCD shield or Pi plate into timestamped events. Each
+    scan reads every button in one read of the expander port. Changes are only taken once
+    the buttons have settled for the debounce time, and buttons held down give long press
+    and repeat events.
+
+    Scans run at a fixed rate from `update`, which returns straight away and can be
+    called as often as convenient, or from the `run` task with ``asyncio``. The
+    ``update`` method of the display calls `update` too.
+
+    Every `Character_LCD_RGB_I2C
+    <adafruit_character_lcd.character_lcd_rgb_i2c.Character_LCD_RGB_I2C>` has a `Keypad`
+    as its ``keypad`` property.
+
+    The following example moves through a menu, repeating while up or down is held, and
+    resets on select and left pressed together.
+
+    .. code-block:: python
+
+        import board
+        from adafruit_character_lcd.character_lcd_rgb_i2c import Character_LCD_RGB_I2C
+        from adafruit_character_lcd.keypad import Keypad
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        lcd = Character_LCD_RGB_I2C(i2c, 16, 2)
+        keypad = lcd.keypad
+        keypad.repeat = 0.1
+        keypad.chords = (Keypad.SELECT | Keypad.LEFT,)
+
+        item = 0
+        while True:
+            lcd.update()
+            event = keypad.get()
+            if event is None:
+                continue
+            if event.kind in {Keypad.PRESS, Keypad.REPEAT}:
+                if event.buttons == Keypad.UP:
+                    item -= 1
+                elif event.buttons == Keypad.DOWN:
+                    item += 1
+            elif event.kind == Keypad.CHORD:
+                item = 0
+            lcd.write_at(0, 0, f"Item {item:<3d}")
+
+    :param ~adafruit_character_lcd.character_lcd_rgb_i2c.Character_LCD_RGB_I2C lcd: The
+        display with the buttons.
+    :param float scan_interval: Seconds between scans.
+    :param float debounce: Seconds the buttons must stay the same for a change to be
+        taken.
+    :param float long_press: Seconds a button is held for a `LONG_PRESS` event, or None
+        for none.
+    :param float repeat_delay: Seconds a button is held before the first `REPEAT` event.
+    :param float repeat: Seconds between `REPEAT` events while a button is held, or None
+        for none.
+    :param Sequence[int] chords: The combinations of buttons that give a `CHORD` event
+        when all of them are held together.
+    :param int max_events: The most events kept for `get`. Once that many are waiting,
+        each new event drops the oldest.
+    """
+
+    #: Buttons, as bits of `Event.buttons`
+    SELECT = 0x01
+    RIGHT = 0x02
+    DOWN = 0x04
+    UP = 0x08
+    LEFT = 0x10
+
+    #: Kinds of `Event`
+    PRESS = 1
+    RELEASE = 2
+    LONG_PRESS = 3
+    REPEAT = 4
+    CHORD = 5
+
+    def __init__(
+        self,
+        lcd: Character_LCD_RGB_I2C,
+        scan_interval: float = 0.01,
+        debounce: float = 0.02,
+        long_press: Optional[float] = 1.0,
+        repeat_delay: float = 0.5,
+        repeat: Optional[float] = None,
+        chords: Sequence[int] = (),
+        max_events: int = 16,
+    ) -> None:
+        self._lcd = lcd
+        self.scan_interval = scan_interval
+        self.debounce = debounce
+        self.long_press = long_press
+        self.repeat_delay = repeat_delay
+        self.repeat = repeat
+        self.chords = chords
+        # Events not yet got, oldest first, bounded so they cannot pile up unread.
+        self._events = deque((), max_events)
+        self._next_scan = 0.0
+        # The buttons as last read and when that changed, and the debounced buttons.
+        self._read = 0
+        self._read_at = 0.0
+        self._held = 0
+        # For each button: when it was pressed, when it next repeats, and whether
+        # its long press has been sent.
+        self._pressed_at = [0.0] * 5
+        self._repeat_at = [0.0] * 5
+        self._long_sent = [False] * 5
+
+    def get(self) -> Optional[Event]:
+        """The oldest event not yet got, or None if there are none."""
+        if self._events:
+            return self._events.popleft()
+        return None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def held(self) -> int:
+        """The buttons held down, debounced, as `Event.buttons` bits."""
+        return self._held
+
+    def update(self) -> bool:
+        """Scan the buttons if a scan is due. Returns True while there are events to get."""
+        now = time.monotonic()
+        if now >= self._next_scan:
+            # Keep a fixed rate, unless scans have fallen behind.
+            self._next_scan += self.scan_interval
+            if self._next_scan < now:
+                self._next_scan = now + self.scan_interval
+            self.scan(now)
+        return bool(self._events)
+
+    async def run(self) -> None:
+        """Scan the buttons at the scan interval forever, as an ``asyncio`` task."""
+        import asyncio  # noqa: PLC0415
+
+        while True:
+            self.update()
+            await asyncio.sleep(self.scan_interval)
+
+    def scan(self, now: Optional[float] = None) -> None:
+        """Read the buttons now, whether or not a scan is due, and add any events.
+
+        :param float now: The ``time.monotonic()`` time of the scan.
+        """
+        if now is None:
+            now = time.monotonic()
+        read = self._lcd.buttons
+        if read != self._read:
+            self._read = read
+            self._read_at = now
+        if read != self._held and now - self._read_at >= self.debounce:
+            self._change(read, now)
+        held = self._held
+        if not held:
+            return
+        for button in range(5):
+            if not held & (1 << button):
+                continue
+            if (
+                self.long_press is not None
+                and not self._long_sent[button]
+                and now - self._pressed_at[button] >= self.long_press
+            ):
+                self._long_sent[button] = True
+                self._events.append(Event(self.LONG_PRESS, 1 << button, now))
+            if self.repeat is not None and now >= self._repeat_at[button]:
+                self._repeat_at[button] += self.repeat
+                if self._repeat_at[button] < now:
+                    self._repeat_at[button] = now + self.repeat
+                self._events.append(Event(self.REPEAT, 1 << button, now))
+
+    def _change(self, held: int, now: float) -> None:
+        # Take the settled buttons ``held``, adding events for what changed.
+        pressed = held & ~self._held
+        released = self._held & ~held
+        self._held = held
+        for button in range(5):
+            bit = 1 << button
+            if pressed & bit:
+                self._pressed_at[button] = now
+                self._repeat_at[button] = now + self.repeat_delay
+                self._long_sent[button] = False
+                self._events.append(Event(self.PRESS, bit, now))
+            elif released & bit:
+                self._events.append(Event(self.RELEASE, bit, now))
+        if pressed and held in self.chords:
+            self._events.append(Event(self.CHORD, held, now))
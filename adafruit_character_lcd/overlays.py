@@ -0,0 +1,182 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd.overlays`
+====================================================
+
+Timed notifications shown over the contents of character LCDs
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from typing import Optional
+
+    from adafruit_character_lcd.character_lcd import Character_LCD
+except ImportError:
+    pass
+
+import time
+
+from adafruit_character_lcd._frames import set_cover
+from adafruit_character_lcd.character_lcd import _LCD_ROW_OFFSETS
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+
+class Overlay:
+    """A message shown by `Overlays.show`. Pass it to `Overlays.hide` to take it down
+    early.
+    """
+
+    def __init__(self, cells: dict, priority: int, expires: Optional[float]) -> None:
+        # Characters by DDRAM address, and when the overlay goes, if ever.
+        self.cells = cells
+        self.priority = priority
+        self.expires = expires
+
+    @property
+    def shown(self) -> bool:
+        """True until the overlay expires or is hidden."""
+        return self.cells is not None
+
+
+class Overlays:
+    """Messages shown over part of a character LCD for a while, such as alerts, menus or
+    notifications. Whatever is written to the display meanwhile is kept rather than
+    shown where an overlay covers it, so when the overlay goes only the characters it
+    covered are written again, without clearing or redrawing the rest of the display.
+
+    Where overlays overlap, the one with the higher priority is shown, or the newer one
+    of equal priority.
+
+    Every `Character_LCD` has an `Overlays` as its ``overlays`` property. Call the
+    display's ``update`` method regularly for overlays to expire.
+
+    The following example shows a notification for 2 seconds over a counter.
+
+    .. code-block:: python
+
+        import board
+        import adafruit_character_lcd.character_lcd_i2c as character_lcd
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2)
+
+        lcd.message = "Count:"
+        lcd.overlays.show("Saved", 11, 1, duration=2)
+        count = 0
+        while True:
+            lcd.write_at(7, 0, str(count))
+            lcd.update()
+            count += 1
+
+    :param ~adafruit_character_lcd.character_lcd.Character_LCD lcd: The display to show
+        the overlays on.
+    """
+
+    def __init__(self, lcd: Character_LCD) -> None:
+        self._lcd = lcd
+        # Shown overlays, oldest first.
+        self._overlays = []
+
+    def show(
+        self,
+        text: str,
+        column: int = 0,
+        row: int = 0,
+        duration: Optional[float] = 3.0,
+        priority: int = 0,
+    ) -> Overlay:
+        """Show ``text`` over the display from ``column`` of ``row``. Lines of ``text``
+        separated by ``"\\n"`` start at ``column`` of the rows below. Text past the last
+        column or row is cut off.
+
+        :param str text: The text to show.
+        :param int column: The column the text starts at.
+        :param int row: The row the text starts on.
+        :param float duration: Seconds to show the text for, or None to show it until
+            it is hidden.
+        :param int priority: Where overlays overlap, the one with the highest priority
+            is shown.
+        :return: The overlay, to hide it with.
+        """
+        lcd = self._lcd
+        cells = {}
+        for line, characters in enumerate(text.split("\n")):
+            if row + line >= lcd.lines:
+                break
+            start = column + _LCD_ROW_OFFSETS[row + line]
+            for index in range(min(len(characters), lcd.columns - column)):
+                cells[start + index] = ord(characters[index]) & 0xFF
+        expires = None if duration is None else time.monotonic() + duration
+        overlay = Overlay(cells, priority, expires)
+        self._overlays.append(overlay)
+        self._cover()
+        return overlay
+
+    def hide(self, overlay: Overlay) -> None:
+        """Take down ``overlay``, showing what it covered. Does nothing if it has already
+        gone.
+
+        :param Overlay overlay: The overlay returned by `show`.
+        """
+        if overlay in self._overlays:
+            self._overlays.remove(overlay)
+            overlay.cells = None
+            self._cover()
+
+    def clear(self) -> None:
+        """Take down every overlay."""
+        for overlay in self._overlays:
+            overlay.cells = None
+        self._overlays = []
+        self._cover()
+
+    def update(self) -> None:
+        """Take down overlays whose time is up. The display's ``update`` calls this."""
+        now = time.monotonic()
+        expired = [
+            overlay
+            for overlay in self._overlays
+            if overlay.expires is not None and now >= overlay.expires
+        ]
+        if expired:
+            for overlay in expired:
+                self._overlays.remove(overlay)
+                overlay.cells = None
+            self._cover()
+
+    def __len__(self) -> int:
+        return len(self._overlays)
+
+    def _cover(self) -> None:
+        # Combine the overlays, lowest priority first so higher ones replace
+        # their characters, and show the result over the display. Equal
+        # priorities are ordered oldest first by their place in the list, as
+        # sorting on MicroPython is not stable.
+        overlays = self._overlays
+        if not overlays:
+            set_cover(self._lcd, None)
+            return
+        cover = {}
+        for index in sorted(
+            range(len(overlays)), key=lambda index: (overlays[index].priority, index)
+        ):
+            cover.update(overlays[index].cells)
+        set_cover(self._lcd, cover)
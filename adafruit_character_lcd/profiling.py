@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd.profiling`
+====================================================
+
+Latency histograms and callbacks for the methods of character LCDs
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from typing import Any, Callable, Sequence
+
+    from adafruit_character_lcd.character_lcd import Character_LCD
+except ImportError:
+    pass
+
+import time
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+# Methods timed by default. The message property is timed through the method its
+# setter calls.
+_METHODS = ("message", "clear", "create_char", "cursor_position", "write_at")
+_PROPERTY_METHODS = {"message": "_show_message"}
+
+
+class Histogram:
+    """Counts of how long calls to one method took, in buckets doubling in size from 1
+    microsecond to 8 seconds, with one more bucket for longer calls.
+    """
+
+    #: The upper bound of each bucket but the last, in nanoseconds.
+    bounds = tuple(1000 << bucket for bucket in range(24))
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add(self, elapsed_ns: int) -> None:
+        """Count a call that took ``elapsed_ns`` nanoseconds."""
+        bounds = self.bounds
+        bucket = 0
+        while bucket < len(bounds) and elapsed_ns > bounds[bucket]:
+            bucket += 1
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+
+    def percentile(self, percent: float) -> float:
+        """The time in seconds that ``percent`` percent of calls took no longer than, to
+        the upper bound of its bucket, or the longest call for the last bucket. Returns 0
+        if nothing has been counted.
+
+        :param float percent: The percentile, such as ``99``.
+        """
+        wanted = self.count * percent / 100
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= wanted:
+                if bucket == len(self.bounds):
+                    return self.max_ns / 1e9
+                return min(self.bounds[bucket], self.max_ns) / 1e9
+        return 0.0
+
+    def reset(self) -> None:
+        """Forget every call counted."""
+        for bucket in range(len(self.counts)):
+            self.counts[bucket] = 0
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+
+class Profiler:
+    """Times calls to the methods of a display, into a `Histogram` for each method, and
+    calls callbacks before and after them. Timing a call only adds to counts that already
+    exist, so nothing is kept that grows with the number of calls. Timed methods that call
+    each other, as ``message`` calls ``cursor_position``, are only timed as the outer call.
+
+    The following example prints the 99th percentile time taken to show messages.
+
+    .. code-block:: python
+
+        import board
+        import adafruit_character_lcd.character_lcd_i2c as character_lcd
+        from adafruit_character_lcd.profiling import Profiler
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2)
+
+        profiler = Profiler(lcd)
+        for count in range(1000):
+            lcd.message = f"Count: {count}"
+        message = profiler.histograms["message"]
+        print(f"p99 {message.percentile(99) * 1000:.1f}ms over {message.count} calls")
+
+    :param ~adafruit_character_lcd.character_lcd.Character_LCD lcd: The display to time.
+    :param Sequence[str] methods: The names of the methods to time. ``message`` times
+        setting the message property. By default ``message``, ``clear``,
+        ``create_char``, ``cursor_position`` and ``write_at``.
+    """
+
+    def __init__(self, lcd: Character_LCD, methods: Sequence[str] = _METHODS) -> None:
+        self._lcd = lcd
+        self.histograms = {name: Histogram() for name in methods}
+        self._before = []
+        self._after = []
+        # How many timed calls are running, so calls they make are not timed too.
+        self._depth = 0
+        # Put a timing wrapper in front of each method for this display only.
+        self._attributes = []
+        for name in methods:
+            attribute = _PROPERTY_METHODS.get(name, name)
+            setattr(lcd, attribute, self._wrap(name, getattr(lcd, attribute)))
+            self._attributes.append(attribute)
+
+    def before(self, callback: Callable[[str], None]) -> Callable[[str], None]:
+        """Call ``callback`` with the name of the method before each timed call. Returns
+        ``callback``, so this can be used as a decorator.
+        """
+        self._before.append(callback)
+        return callback
+
+    def after(self, callback: Callable[[str, int], None]) -> Callable[[str, int], None]:
+        """Call ``callback`` with the name of the method and the nanoseconds it took after
+        each timed call, including calls that raise. Returns ``callback``, so this can be
+        used as a decorator.
+        """
+        self._after.append(callback)
+        return callback
+
+    def reset(self) -> None:
+        """Forget every call timed."""
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+    def stop(self) -> None:
+        """Stop timing calls. The histograms are kept."""
+        for attribute in self._attributes:
+            delattr(self._lcd, attribute)
+        self._attributes = []
+
+    def _wrap(self, name: str, method: Callable) -> Callable:
+        histogram = self.histograms[name]
+        before = self._before
+        after = self._after
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            if self._depth:
+                # Part of the timed call that made it.
+                return method(*args, **kwargs)
+            self._depth += 1
+            try:
+                for callback in before:
+                    callback(name)
+                start = time.monotonic_ns()
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    elapsed = time.monotonic_ns() - start
+                    histogram.add(elapsed)
+                    for callback in after:
+                        callback(name, elapsed)
+            finally:
+                # Even when a callback raises, so later calls are still timed.
+                self._depth -= 1
+
+        return timed
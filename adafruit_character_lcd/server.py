@@ -0,0 +1,390 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd.server`
+====================================================
+
+Display server sharing character LCDs between processes over a Unix domain socket
+
+A single server process owns the displays. Clients connect to its socket and send
+messages, each a 4 byte header of operation, display number and payload length (a
+little endian ``uint16``), followed by the payload:
+
+======  ==============  ===============================================================
+Op      Name            Payload
+======  ==============  ===============================================================
+``1``   write           column, row, then the characters to show there
+``2``   create char     custom character location, then its 8 pattern bytes
+``3``   clear           none
+``4``   color           1 byte backlight on or off, or 3 bytes red, green and blue 0 - 100
+``5``   subscribe       none: send keypad events for the display to this client
+======  ==============  ===============================================================
+
+Clients that subscribe receive ``0x80`` keypad messages with the same header and a 1 byte
+payload of the buttons held: select, right, down, up and left from bit 0.
+
+The server applies writes from every client to a frame of each display, then writes each
+changed row once with `write_at <adafruit_character_lcd.character_lcd.Character_LCD.write_at>`,
+which sends only the characters that differ from what is shown. Clients only ever write
+to the socket, so they never wait on the display.
+
+Run the server with ``charlcd-server --lcd "rgb-i2c://0x20?bus=1"``.
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Linux, or another OS with Unix domain sockets
+
+"""
+
+try:
+    from typing import List, Optional, Sequence
+
+    from adafruit_character_lcd.character_lcd import Character_LCD
+except ImportError:
+    pass
+
+import argparse
+import errno
+import os
+import selectors
+import socket
+import stat
+import struct
+import sys
+import time
+
+import adafruit_character_lcd
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+_HEADER = struct.Struct("<BBH")
+
+OP_WRITE = 1
+OP_CREATE_CHAR = 2
+OP_CLEAR = 3
+OP_COLOR = 4
+OP_SUBSCRIBE = 5
+OP_KEYS = 0x80
+
+# Keypad buttons, from bit 0 of a keys message.
+_BUTTONS = ("select_button", "right_button", "down_button", "up_button", "left_button")
+
+
+class DisplayServer:
+    """Owns one or more character LCDs and takes updates for them from clients connected
+    to a Unix domain socket.
+
+    .. code-block:: python
+
+        import adafruit_character_lcd
+        from adafruit_character_lcd.server import DisplayServer
+
+        lcd = adafruit_character_lcd.open("rgb-i2c://0x20?bus=1")
+        DisplayServer("/run/charlcd.sock", [lcd]).serve_forever()
+
+    :param str path: The path of the socket to listen on.
+    :param Sequence[Character_LCD] lcds: The displays, numbered from 0 in the protocol.
+    :param float key_interval: Seconds between reads of the keypad buttons while any
+        client is subscribed to them.
+
+    Bus errors writing to a display, once the display has retried and resynchronised as
+    set by its ``retries``, are reported on standard error and do not stop the server.
+    Rows that could not be written are written again on the next poll.
+    """
+
+    def __init__(
+        self, path: str, lcds: Sequence[Character_LCD], key_interval: float = 0.05
+    ) -> None:
+        self.path = path
+        self.lcds = list(lcds)
+        self.key_interval = key_interval
+        # What each display should show, and whether each of its rows has changed.
+        self._frames = [bytearray(b" " * lcd.columns * lcd.lines) for lcd in self.lcds]
+        self._dirty = [[False] * lcd.lines for lcd in self.lcds]
+        # Clients subscribed to each display's keypad, and its buttons last read.
+        self._subscribers = [set() for _ in self.lcds]
+        self._keys = [0] * len(self.lcds)
+        self._next_keys = 0.0
+        self._buffers = {}
+        # Whether a bus error has been reported for each display since it last worked.
+        self._failing = [False] * len(self.lcds)
+        self._selector = selectors.DefaultSelector()
+        if os.path.exists(path):
+            # Only take over a socket left behind by a server that has gone.
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise OSError(errno.EEXIST, "Not a socket", path)
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(path)
+            except OSError:
+                os.unlink(path)
+            else:
+                raise OSError(errno.EADDRINUSE, "A display server is already listening", path)
+            finally:
+                probe.close()
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(path)
+        self._listener.listen()
+        self._listener.setblocking(False)
+        self._selector.register(self._listener, selectors.EVENT_READ)
+
+    def serve_forever(self) -> None:
+        """Handle clients and update the displays until interrupted."""
+        try:
+            while True:
+                self.poll(self.key_interval)
+        finally:
+            self.close()
+
+    def poll(self, timeout: Optional[float] = 0.0) -> None:
+        """Accept clients, apply everything they have sent, then write what changed to the
+        displays, keep any backlight dimming or color fade running and send keypad events.
+
+        :param float timeout: Seconds to wait for a client to send something.
+        """
+        for key, _ in self._selector.select(timeout):
+            if key.fileobj is self._listener:
+                self._accept()
+            else:
+                self._receive(key.fileobj)
+        self._flush()
+        for display, lcd in enumerate(self.lcds):
+            if hasattr(lcd, "update"):
+                try:
+                    lcd.update()
+                except OSError as error:
+                    self._report(display, error)
+        now = time.monotonic()
+        if now >= self._next_keys:
+            self._next_keys = now + self.key_interval
+            self._send_keys()
+
+    def close(self) -> None:
+        """Disconnect every client and remove the socket."""
+        for client in list(self._buffers):
+            self._drop(client)
+        self._selector.unregister(self._listener)
+        self._listener.close()
+        self._selector.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _accept(self) -> None:
+        client, _ = self._listener.accept()
+        client.setblocking(False)
+        self._buffers[client] = bytearray()
+        self._selector.register(client, selectors.EVENT_READ)
+
+    def _drop(self, client: socket.socket) -> None:
+        self._selector.unregister(client)
+        del self._buffers[client]
+        for subscribers in self._subscribers:
+            subscribers.discard(client)
+        client.close()
+
+    def _receive(self, client: socket.socket) -> None:
+        # Apply every complete message the client has sent. A client that closes
+        # its connection or breaks the protocol is dropped.
+        try:
+            data = client.recv(4096)
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(client)
+            return
+        buffer = self._buffers[client]
+        buffer += data
+        start = 0
+        while len(buffer) - start >= _HEADER.size:
+            op, display, length = _HEADER.unpack_from(buffer, start)
+            end = start + _HEADER.size + length
+            if end > len(buffer):
+                break
+            try:
+                self._apply(client, op, display, bytes(buffer[start + _HEADER.size : end]))
+            except (AttributeError, IndexError, ValueError):
+                self._drop(client)
+                return
+            except OSError as error:
+                # The display failed, not the client: keep serving it.
+                self._report(display, error)
+            start = end
+        del buffer[:start]
+
+    def _apply(self, client: socket.socket, op: int, display: int, payload: bytes) -> None:
+        lcd = self.lcds[display]
+        if op == OP_WRITE:
+            column, row = payload[0], payload[1]
+            if row >= lcd.lines or column >= lcd.columns:
+                raise ValueError("Write outside the display")
+            text = payload[2 : 2 + lcd.columns - column]
+            start = row * lcd.columns + column
+            self._frames[display][start : start + len(text)] = text
+            self._dirty[display][row] = True
+        elif op == OP_CREATE_CHAR:
+            lcd.create_char(payload[0], payload[1:9])
+        elif op == OP_CLEAR:
+            # Blank the frame rather than clearing the display, so that only what
+            # is shown changes, and without a flicker.
+            self._frames[display][:] = b" " * len(self._frames[display])
+            self._dirty[display] = [True] * lcd.lines
+        elif op == OP_COLOR:
+            # Check the class, as setting either on a display without it would
+            # only add an attribute.
+            if len(payload) == 3:
+                if not hasattr(type(lcd), "color"):
+                    raise ValueError("Color for a display without an RGB backlight")
+                lcd.color = list(payload)
+            else:
+                if not hasattr(type(lcd), "backlight"):
+                    raise ValueError("Backlight for a display without one")
+                lcd.backlight = bool(payload[0])
+        elif op == OP_SUBSCRIBE:
+            self._subscribers[display].add(client)
+        else:
+            raise ValueError("Unknown operation")
+
+    def _flush(self) -> None:
+        # Write each changed row once: write_at sends only the characters that
+        # differ from what the display shows.
+        for display, lcd in enumerate(self.lcds):
+            dirty = self._dirty[display]
+            frame = self._frames[display]
+            try:
+                for row in range(lcd.lines):
+                    if dirty[row]:
+                        start = row * lcd.columns
+                        lcd.write_at(0, row, frame[start : start + lcd.columns].decode("latin-1"))
+                        dirty[row] = False
+            except OSError as error:
+                self._report(display, error)
+            else:
+                self._failing[display] = False
+
+    def _report(self, display: int, error: OSError) -> None:
+        # Report a bus error on ``display``, once until it next works.
+        if not self._failing[display]:
+            self._failing[display] = True
+            print(f"Display {display}: {error}", file=sys.stderr)
+
+    def _send_keys(self) -> None:
+        for display, subscribers in enumerate(self._subscribers):
+            if not subscribers:
+                continue
+            lcd = self.lcds[display]
+            if hasattr(lcd, "buttons"):
+                # every button in one read, in the same bit order
+                keys = lcd.buttons
+            else:
+                keys = 0
+                for bit, name in enumerate(_BUTTONS):
+                    if getattr(lcd, name, False):
+                        keys |= 1 << bit
+            if keys != self._keys[display]:
+                self._keys[display] = keys
+                message = _HEADER.pack(OP_KEYS, display, 1) + bytes((keys,))
+                for client in list(subscribers):
+                    try:
+                        client.send(message)
+                    except OSError:
+                        self._drop(client)
+
+
+class DisplayClient:
+    """A connection to a `DisplayServer`. Every method only writes to the socket, so none
+    of them wait for the display.
+
+    .. code-block:: python
+
+        from adafruit_character_lcd.server import DisplayClient
+
+        display = DisplayClient("/run/charlcd.sock")
+        display.write(0, 0, "Temp: 21.5C")
+        display.color([0, 100, 0])
+
+    :param str path: The path of the server's socket.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(path)
+
+    def write(self, column: int, row: int, text: str, display: int = 0) -> None:
+        """Show ``text`` from ``column`` of ``row``. Characters past the end of the row are
+        dropped.
+
+        :param int column: The column to start at.
+        :param int row: The row to write to.
+        :param str text: The characters to show, with codes 0 - 255.
+        :param int display: The display to write to.
+        """
+        self._send(OP_WRITE, display, bytes((column, row)) + text.encode("latin-1"))
+
+    def create_char(self, location: int, pattern: Sequence[int], display: int = 0) -> None:
+        """Create a custom character, as `Character_LCD.create_char
+        <adafruit_character_lcd.character_lcd.Character_LCD.create_char>` does."""
+        self._send(OP_CREATE_CHAR, display, bytes((location,)) + bytes(pattern))
+
+    def clear(self, display: int = 0) -> None:
+        """Blank the display."""
+        self._send(OP_CLEAR, display, b"")
+
+    def color(self, color: List[int], display: int = 0) -> None:
+        """Set the color of an RGB display, as ``[R, G, B]`` levels 0 - 100."""
+        self._send(OP_COLOR, display, bytes(color))
+
+    def backlight(self, enable: bool, display: int = 0) -> None:
+        """Turn the backlight of a monochrome display on or off."""
+        self._send(OP_COLOR, display, bytes((enable,)))
+
+    def subscribe(self, display: int = 0) -> None:
+        """Receive the keypad buttons of the display from `read_keys` whenever they change."""
+        self._send(OP_SUBSCRIBE, display, b"")
+
+    def read_keys(self) -> tuple:
+        """Wait for the buttons held on a subscribed display to change.
+
+        :return: The display number, and the buttons held: select, right, down, up and left
+            from bit 0.
+        """
+        message = b""
+        while len(message) < _HEADER.size + 1:
+            data = self.socket.recv(_HEADER.size + 1 - len(message))
+            if not data:
+                raise ConnectionError("Display server closed the connection")
+            message += data
+        _, display, _ = _HEADER.unpack_from(message)
+        return display, message[_HEADER.size]
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.socket.close()
+
+    def _send(self, op: int, display: int, payload: bytes) -> None:
+        self.socket.sendall(_HEADER.pack(op, display, len(payload)) + payload)
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    """Run a display server from the command line."""
+    parser = argparse.ArgumentParser(description="Share character LCDs between processes.")
+    parser.add_argument("--socket", default="/run/charlcd.sock", help="socket to listen on")
+    parser.add_argument(
+        "--lcd",
+        action="append",
+        required=True,
+        help="display to serve, as an adafruit_character_lcd.open() URI; repeat for more",
+    )
+    options = parser.parse_args(args)
+    lcds = [adafruit_character_lcd.open(spec) for spec in options.lcd]
+    DisplayServer(options.socket, lcds).serve_forever()
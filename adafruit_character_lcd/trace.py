@@ -0,0 +1,294 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd.trace`
+====================================================
+
+Record what the driver sends to character LCDs, and replay it into a display or an
+emulator
+
+A trace file starts with an 8 byte header: ``b"LCDT"``, the format version, and the
+columns and lines of the display, then a zero byte. Each byte sent to the display
+follows as a 6 byte record: the microseconds since the record before as a little
+endian ``uint32``, ``1`` for a character or ``0`` for a command, and the byte.
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from typing import BinaryIO, Iterator, Optional, Tuple, Union
+
+    from adafruit_character_lcd.character_lcd import Character_LCD
+except ImportError:
+    pass
+
+import struct
+import time
+
+from micropython import const
+
+from adafruit_character_lcd.character_lcd import _LCD_DDRAM_BLANK, _LCD_ROW_OFFSETS
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+_MAGIC = b"LCDT"
+_VERSION = 1
+# Each record: microseconds since the last one, RS and the byte written.
+_RECORD_FORMAT = "<IBB"
+_RECORD_SIZE = const(6)  # struct.calcsize(_RECORD_FORMAT)
+
+
+class Recorder:
+    """Records every byte the driver sends to a display, with when it was sent, to a
+    trace file. Everything written through the driver is recorded, including the
+    commands sent to resynchronise the display after bus errors, but not reads.
+
+    The following example records a minute of a dashboard.
+
+    .. code-block:: python
+
+        import time
+        import board
+        import adafruit_character_lcd.character_lcd_i2c as character_lcd
+        from adafruit_character_lcd.trace import Recorder
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2)
+
+        with open("/dashboard.lcdt", "wb") as file, Recorder(lcd, file):
+            start = time.monotonic()
+            while time.monotonic() - start < 60:
+                lcd.write_at(0, 0, f"Uptime: {time.monotonic() - start:6.1f}")
+
+    :param ~adafruit_character_lcd.character_lcd.Character_LCD lcd: The display to
+        record.
+    :param file: A binary file, or other stream, to write the trace to.
+    """
+
+    def __init__(self, lcd: Character_LCD, file: BinaryIO) -> None:
+        self._lcd = lcd
+        self._file = file
+        self._record = bytearray(_RECORD_SIZE)
+        file.write(_MAGIC + bytes((_VERSION, lcd.columns, lcd.lines, 0)))
+        self._last = time.monotonic_ns()
+        # Record at _write8, which every backend implements, by putting the
+        # recorder in front of it for this display only.
+        self._write8 = lcd._write8
+        lcd._write8 = self._write
+
+    def stop(self) -> None:
+        """Stop recording. The file is left open."""
+        self._lcd._write8 = self._write8
+
+    def __enter__(self) -> "Recorder":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.stop()
+
+    def _write(self, value: int, char_mode: bool = False) -> None:
+        now = time.monotonic_ns()
+        delay = min((now - self._last) // 1000, 0xFFFFFFFF)
+        self._last = now
+        struct.pack_into(_RECORD_FORMAT, self._record, 0, delay, 1 if char_mode else 0, value)
+        self._file.write(self._record)
+        self._write8(value, char_mode)
+
+
+def records(file: BinaryIO) -> Iterator[Tuple[int, bool, int]]:
+    """Read a trace file.
+
+    :param file: A binary file, or other stream, to read the trace from.
+    :return: For each byte sent, the microseconds since the byte before, whether it is a
+        character rather than a command, and the byte.
+    """
+    header = file.read(8)
+    if len(header) < 8 or header[:4] != _MAGIC or header[4] != _VERSION:
+        raise ValueError("Not a character LCD trace")
+    record = bytearray(_RECORD_SIZE)
+    while file.readinto(record) == _RECORD_SIZE:
+        delay, char_mode, value = struct.unpack(_RECORD_FORMAT, record)
+        yield delay, bool(char_mode), value
+
+
+def replay(
+    file: BinaryIO, target: Union[Character_LCD, "Emulator"], speed: Optional[float] = 1.0
+) -> None:
+    """Send a recorded trace to a display, of any backend, or to an `Emulator`.
+
+    After a trace is replayed into a display, the driver no longer knows what the display
+    shows or where its cursor is. Call ``clear`` on the display before using it again.
+
+    The following example times a recorded trace on another backend.
+
+    .. code-block:: python
+
+        import time
+        import board
+        from adafruit_character_lcd.character_lcd_pcf8574 import Character_LCD_PCF8574
+        from adafruit_character_lcd.trace import replay
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        lcd = Character_LCD_PCF8574(i2c, 16, 2)
+
+        start = time.monotonic()
+        with open("/dashboard.lcdt", "rb") as file:
+            replay(file, lcd, speed=None)
+        print(f"{time.monotonic() - start:.2f}s")
+
+    :param file: A binary file, or other stream, to read the trace from.
+    :param target: The display or emulator to send the trace to.
+    :param float speed: How many times faster than it was recorded to replay the trace,
+        or None to replay it as fast as the target takes it.
+    """
+    if isinstance(target, Emulator):
+        write = target.write8
+    else:
+        write = target._write8
+        target._address = None
+        target._cgram_address = None
+    elapsed = 0
+    start = time.monotonic_ns()
+    for delay, char_mode, value in records(file):
+        if speed is not None:
+            # Keep to the recorded times from the start, so sleeping does not add up.
+            elapsed += delay
+            wait = start + int(elapsed * 1000 / speed) - time.monotonic_ns()
+            if wait > 0:
+                time.sleep(wait / 1e9)
+        write(value, char_mode)
+
+
+class Emulator:
+    """An HD44780 display controller, in 2 line mode, that takes the bytes of a trace and
+    keeps what a display would show, for looking at traces and profiling them off the
+    device.
+
+    .. code-block:: python
+
+        from adafruit_character_lcd.trace import Emulator, replay
+
+        emulator = Emulator(16, 2)
+        with open("dashboard.lcdt", "rb") as file:
+            replay(file, emulator, speed=None)
+        print("\\n".join(emulator.rows))
+        print(emulator.commands, "commands,", emulator.characters, "characters")
+        print(f"{emulator.busy_time:.3f}s executing them")
+
+    :param int columns: The columns on the display.
+    :param int lines: The lines on the display.
+    """
+
+    def __init__(self, columns: int, lines: int) -> None:
+        self.columns = columns
+        self.lines = lines
+        self.ddram = bytearray(_LCD_DDRAM_BLANK)
+        self.cgram = bytearray(64)
+        # Display control, entry mode and function set registers as last set.
+        self.control = 0
+        self.mode = 0x02
+        self.function = 0
+        self.address = 0
+        self.cgram_selected = False
+        self.shift = 0
+        self.commands = 0
+        self.characters = 0
+        self.busy_time = 0.0
+
+    @property
+    def rows(self) -> list:
+        """The text each row of the display shows, with the display shift applied."""
+        rows = []
+        for row in range(self.lines):
+            start = _LCD_ROW_OFFSETS[row]
+            line = start & 0x40
+            rows.append(
+                "".join(
+                    chr(self.ddram[line + (start - line + column - self.shift) % 40])
+                    for column in range(self.columns)
+                )
+            )
+        return rows
+
+    def write8(self, value: int, char_mode: bool = False) -> None:
+        """Take a byte sent to the display.
+
+        :param int value: The byte.
+        :param bool char_mode: True for a character, False for a command.
+        """
+        increment = self.mode & 0x02
+        if char_mode:
+            self.characters += 1
+            self.busy_time += 0.000041
+            if self.cgram_selected:
+                self.cgram[self.address] = value
+                self.address = (self.address + (1 if increment else -1)) & 0x3F
+            else:
+                self.ddram[self.address] = value
+                self.address = self._step(self.address, increment)
+                if self.mode & 0x01:
+                    self.shift += -1 if increment else 1
+            return
+        self.commands += 1
+        self.busy_time += 0.00152 if value < 0x04 else 0.000037
+        if value & 0x80:
+            # addresses past the end of the first line are taken as the second's
+            self.address = value & 0x7F
+            if 0x28 <= self.address < 0x40 or self.address >= 0x68:
+                self.address = 0x40
+            self.cgram_selected = False
+        elif value & 0x40:
+            self.address = value & 0x3F
+            self.cgram_selected = True
+        elif value & 0x20:
+            self.function = value
+        elif value & 0x10:
+            right = value & 0x04
+            if value & 0x08:
+                self.shift += 1 if right else -1
+            elif not self.cgram_selected:
+                self.address = self._step(self.address, right)
+        elif value & 0x08:
+            self.control = value & 0x07
+        elif value & 0x04:
+            self.mode = value & 0x03
+        elif value & 0x02:
+            self.address = 0
+            self.cgram_selected = False
+            self.shift = 0
+        elif value:
+            self.ddram[:] = _LCD_DDRAM_BLANK
+            self.address = 0
+            self.cgram_selected = False
+            self.shift = 0
+            self.mode |= 0x02
+
+    @staticmethod
+    def _step(address: int, increment: bool) -> int:
+        # The DDRAM address after ``address``, as the display steps it in 2 line mode.
+        if increment:
+            if address == 0x27:
+                return 0x40
+            if address == 0x67:
+                return 0x00
+            return address + 1
+        if address == 0x00:
+            return 0x67
+        if address == 0x40:
+            return 0x27
+        return address - 1
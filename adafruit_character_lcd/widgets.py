@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_character_lcd.widgets`
+====================================================
+
+Bar graph and sparkline widgets drawn with custom characters on character LCDs
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit Character LCDs
+  <http://www.adafruit.com/category/63_96>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+try:
+    from adafruit_character_lcd.character_lcd import Character_LCD
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CharLCD.git"
+
+# Built in characters for an empty and a completely filled cell.
+_EMPTY = " "
+_FULL = "\xff"
+
+# Cells with the leftmost 1 - 4 pixel columns filled.
+_BAR_GLYPHS = tuple(bytes([(0x1F << (5 - columns)) & 0x1F] * 8) for columns in range(1, 5))
+# Cells with the bottom 1 - 7 pixel rows filled.
+_LEVEL_GLYPHS = tuple(
+    bytes(0x1F if row >= 8 - rows else 0x00 for row in range(8)) for rows in range(1, 8)
+)
+
+
+def _load_glyphs(lcd: Character_LCD, first_slot: int, glyphs: tuple) -> str:
+    # Load ``glyphs`` into consecutive custom characters and return the characters
+    # that show them.
+    if not 0 <= first_slot <= 8 - len(glyphs):
+        raise ValueError(f"first_slot must leave room for {len(glyphs)} custom characters")
+    for index, glyph in enumerate(glyphs):
+        lcd.create_char(first_slot + index, glyph)
+    return "".join(chr(first_slot + index) for index in range(len(glyphs)))
+
+
+class HorizontalBar:
+    """A horizontal bar graph that fills its cells one pixel column at a time, giving
+    five steps per cell. Uses four custom characters, starting at ``first_slot``. Setting
+    a new `value` only sends the cells that change.
+
+    The following example shows a progress bar across the bottom row.
+
+    .. code-block:: python
+
+        import board
+        import adafruit_character_lcd.character_lcd_i2c as character_lcd
+        from adafruit_character_lcd.widgets import HorizontalBar
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2)
+
+        lcd.message = "Downloading"
+        bar = HorizontalBar(lcd, 0, 1, 16)
+        for percent in range(101):
+            bar.value = percent
+
+    :param ~adafruit_character_lcd.character_lcd.Character_LCD lcd: The display to draw on.
+    :param int column: The column the bar starts at.
+    :param int row: The row the bar is on.
+    :param int width: The number of cells in the bar.
+    :param float minimum: The value shown as an empty bar.
+    :param float maximum: The value shown as a full bar.
+    :param int first_slot: The first of the four custom characters to use, 0 - 4.
+    """
+
+    def __init__(
+        self,
+        lcd: Character_LCD,
+        column: int,
+        row: int,
+        width: int,
+        minimum: float = 0,
+        maximum: float = 100,
+        first_slot: int = 0,
+    ) -> None:
+        self._lcd = lcd
+        self._column = column
+        self._row = row
+        self._width = width
+        self._minimum = minimum
+        self._maximum = maximum
+        self._value = minimum
+        # cells filled from 1 to 4 pixel columns
+        self._partial = _EMPTY + _load_glyphs(lcd, first_slot, _BAR_GLYPHS)
+        self.value = minimum
+
+    @property
+    def value(self) -> float:
+        """The value shown by the bar. Values outside the range of the bar are shown as an
+        empty or full bar.
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value: float) -> None:
+        self._value = value
+        steps = self._width * 5
+        filled = int((value - self._minimum) * steps / (self._maximum - self._minimum) + 0.5)
+        filled = max(0, min(steps, filled))
+        full, partial = divmod(filled, 5)
+        text = _FULL * full
+        if full < self._width:
+            text += self._partial[partial] + _EMPTY * (self._width - full - 1)
+        self._lcd.write_at(self._column, self._row, text)
+
+
+class Sparkline:
+    """A scrolling chart of recent values, one column of cells per value, with the
+    newest value at the right. Each cell has eight levels, so a sparkline ``height``
+    rows tall shows ``8 * height`` levels. Uses seven custom characters, starting at
+    ``first_slot``. Values are kept in a ring buffer and each new value only sends the
+    cells that change.
+
+    The following example charts a reading once a second along the bottom row.
+
+    .. code-block:: python
+
+        import time
+        import board
+        import microcontroller
+        import adafruit_character_lcd.character_lcd_i2c as character_lcd
+        from adafruit_character_lcd.widgets import Sparkline
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        lcd = character_lcd.Character_LCD_I2C(i2c, 16, 2)
+
+        lcd.message = "CPU temperature"
+        chart = Sparkline(lcd, 0, 1, 16, minimum=20, maximum=60)
+        while True:
+            chart.append(microcontroller.cpu.temperature)
+            time.sleep(1)
+
+    :param ~adafruit_character_lcd.character_lcd.Character_LCD lcd: The display to draw on.
+    :param int column: The column the sparkline starts at.
+    :param int row: The top row of the sparkline.
+    :param int width: The number of values shown, one per column.
+    :param int height: The number of rows the sparkline is tall.
+    :param float minimum: The value shown as an empty column.
+    :param float maximum: The value shown as a full column.
+    :param int first_slot: The first of the seven custom characters to use, 0 or 1.
+    """
+
+    def __init__(
+        self,
+        lcd: Character_LCD,
+        column: int,
+        row: int,
+        width: int,
+        height: int = 1,
+        minimum: float = 0,
+        maximum: float = 100,
+        first_slot: int = 0,
+    ) -> None:
+        self._lcd = lcd
+        self._column = column
+        self._row = row
+        self._width = width
+        self._height = height
+        self._minimum = minimum
+        self._maximum = maximum
+        # cells filled from 0 to 8 pixel rows
+        self._cells = _EMPTY + _load_glyphs(lcd, first_slot, _LEVEL_GLYPHS) + _FULL
+        # ring buffer of levels, oldest first starting at _start
+        self._levels = bytearray(width)
+        self._start = 0
+
+    def append(self, value: float) -> None:
+        """Add a value at the right of the sparkline, scrolling the oldest value off the
+        left. Values outside the range of the sparkline are shown as an empty or full column.
+
+        :param float value: The value to add.
+        """
+        levels = self._height * 8
+        level = int((value - self._minimum) * levels / (self._maximum - self._minimum) + 0.5)
+        self._levels[self._start] = max(0, min(levels, level))
+        self._start = (self._start + 1) % self._width
+        self._draw()
+
+    def clear(self) -> None:
+        """Remove every value from the sparkline."""
+        for index in range(self._width):
+            self._levels[index] = 0
+        self._draw()
+
+    def _draw(self) -> None:
+        # Show the levels oldest to newest, leaving write_at to send only the cells
+        # that differ from what is displayed.
+        width = self._width
+        for line in range(self._height):
+            # the level each cell on this line starts at
+            base = (self._height - 1 - line) * 8
+            text = ""
+            for index in range(width):
+                level = self._levels[(self._start + index) % width] - base
+                text += self._cells[max(0, min(8, level))]
+            self._lcd.write_at(self._column, self._row + line, text)
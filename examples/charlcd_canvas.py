@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""Scroll through a menu longer and wider than the display with the keypad on I2C RGB
+character LCD Shield or Pi Plate kits"""
+
+import time
+
+import board
+
+import adafruit_character_lcd.character_lcd_rgb_i2c as character_lcd
+from adafruit_character_lcd.canvas import Canvas
+
+# Modify this if you have a different sized Character LCD
+lcd_columns = 16
+lcd_rows = 2
+
+# Initialise I2C bus.
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+
+# Initialise the LCD class
+lcd = character_lcd.Character_LCD_RGB_I2C(i2c, lcd_columns, lcd_rows)
+lcd.color = [0, 0, 100]
+
+# Write the whole menu to the canvas once
+items = [
+    "1 Brightness",
+    "2 Contrast",
+    "3 Network settings and status",
+    "4 Restart",
+    "5 About this device",
+]
+canvas = Canvas(lcd, 30, len(items))
+for row, item in enumerate(items):
+    canvas.write(0, row, item)
+
+while True:
+    # Only the characters that change are sent when scrolling up and down, and
+    # scrolling sideways shifts the display
+    if lcd.down_button:
+        canvas.scroll(0, 1)
+    elif lcd.up_button:
+        canvas.scroll(0, -1)
+    elif lcd.right_button:
+        canvas.scroll(1, 0)
+    elif lcd.left_button:
+        canvas.scroll(-1, 0)
+    time.sleep(0.2)
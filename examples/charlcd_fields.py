@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""Update fixed fields of a dashboard in place on an MCP23008 I2C LCD backpack."""
+
+import time
+
+import board
+
+import adafruit_character_lcd.character_lcd_i2c as character_lcd
+
+# Modify this if you have a different sized Character LCD
+lcd_columns = 16
+lcd_rows = 2
+
+# Initialise I2C bus.
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+
+# Initialise the lcd class
+lcd = character_lcd.Character_LCD_I2C(i2c, lcd_columns, lcd_rows)
+lcd.backlight = True
+
+# Draw the labels once
+lcd.message = "Uptime:       s\nLoops:"
+
+# Lay out the fields that change
+lcd.fields.add("uptime", 8, 0, 6, align=">", fmt="{:.1f}")
+lcd.fields.add("loops", 7, 1, 9, align=">")
+
+start = time.monotonic()
+loops = 0
+while True:
+    # Only the characters that change are sent to the display
+    lcd.fields["uptime"] = time.monotonic() - start
+    lcd.fields["loops"] = loops
+    loops += 1
@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""Measure the RAM taken by importing the library and creating an MCP23008 I2C LCD
+backpack display, for fitting a display into boards with little RAM. Run it straight
+after a reset, with the library installed as .mpy files or frozen in."""
+
+import gc
+
+import board
+
+# Modify this if you have a different sized Character LCD
+lcd_columns = 16
+lcd_rows = 2
+
+# Set up the bus first, so only the library is measured
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+
+gc.collect()
+start = gc.mem_free()
+
+import adafruit_character_lcd.character_lcd_i2c as character_lcd
+
+gc.collect()
+imported = gc.mem_free()
+
+lcd = character_lcd.Character_LCD_I2C(i2c, lcd_columns, lcd_rows)
+
+gc.collect()
+created = gc.mem_free()
+
+lcd.message = "Hello\nCircuitPython"
+
+gc.collect()
+written = gc.mem_free()
+
+print("Import:  ", start - imported, "bytes")
+print("Instance:", imported - created, "bytes")
+print("Message: ", created - written, "bytes")
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""Simple test for 16x2 character lcd connected to a PCF8574 I2C LCD backpack."""
+
+import time
+
+import board
+
+import adafruit_character_lcd.character_lcd_pcf8574 as character_lcd
+
+# Modify this if you have a different sized Character LCD
+lcd_columns = 16
+lcd_rows = 2
+
+# Initialise I2C bus.
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+
+# Initialise the lcd class. Most PCF8574 backpacks are at 0x27, PCF8574A ones at 0x3F.
+lcd = character_lcd.Character_LCD_PCF8574(i2c, lcd_columns, lcd_rows, address=0x27)
+
+# Turn backlight on
+lcd.backlight = True
+# Print a two line message
+lcd.message = "Hello\nCircuitPython"
+# Wait 5s
+time.sleep(5)
+# Count up, updating only the digits that change
+lcd.clear()
+lcd.message = "Count:"
+for count in range(1000):
+    lcd.write_at(7, 0, str(count))
+    time.sleep(0.05)
+# Turn backlight off
+lcd.backlight = False